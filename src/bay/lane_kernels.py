@@ -0,0 +1,157 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Compiled kernels of the reshuffling simulator on the stacks matrix of a
+LaneMatrix (lanes x max depth, padded with PADDING).
+
+The kernels are compiled with numba if it is installed. Without numba they
+are plain python functions and LaneMatrix keeps its numpy implementation,
+see USE_KERNELS.
+"""
+
+import numpy as np
+
+try:
+    import numba
+except ImportError:
+    numba = None
+
+HAS_NUMBA = numba is not None
+
+# LaneMatrix uses the kernels only if they are compiled
+USE_KERNELS = HAS_NUMBA
+
+
+def _jit(func):
+    if numba is None:
+        return func
+    return numba.njit(cache=True, nogil=True)(func)
+
+
+@_jit
+def top_load_index(stacks, lane, reversed=False):
+    """
+    Index of the load removed next from the lane, -1 if the lane is empty.
+    """
+    depth = stacks.shape[1]
+    for k in range(depth):
+        i = depth - 1 - k if reversed else k
+        if stacks[lane, i] > 0:
+            return i
+    return -1
+
+
+@_jit
+def free_slot_index(stacks, lane, reversed=False):
+    """
+    Index of the slot filled next in the lane, -1 if the lane is full.
+    """
+    depth = stacks.shape[1]
+    for k in range(depth):
+        i = k if reversed else depth - 1 - k
+        if stacks[lane, i] == 0:
+            return i
+    return -1
+
+
+@_jit
+def is_lane_unsorted(stacks, lengths, lane, reversed=False):
+    for i in range(1, lengths[lane]):
+        if reversed:
+            if stacks[lane, i] > stacks[lane, i - 1]:
+                return True
+        elif stacks[lane, i] < stacks[lane, i - 1]:
+            return True
+    return False
+
+
+@_jit
+def get_moves(stacks, reversed=False):
+    """
+    All moves from a lane with loads to another lane with free slots, in the
+    order of LaneMatrix.get_moves. Returns from lanes, to lanes and priorities.
+    """
+    n_lanes = stacks.shape[0]
+    top = np.empty(n_lanes, dtype=np.int64)
+    free = np.empty(n_lanes, dtype=np.int64)
+    n_from = 0
+    n_to = 0
+    n_both = 0
+    for lane in range(n_lanes):
+        top[lane] = top_load_index(stacks, lane, reversed)
+        free[lane] = free_slot_index(stacks, lane, reversed)
+        n_from += top[lane] >= 0
+        n_to += free[lane] >= 0
+        n_both += top[lane] >= 0 and free[lane] >= 0
+
+    # lanes with loads and free slots do not move to themselves
+    n_moves = n_from * n_to - n_both
+    from_lanes = np.empty(n_moves, dtype=np.int64)
+    to_lanes = np.empty(n_moves, dtype=np.int64)
+    priorities = np.empty(n_moves, dtype=np.int64)
+    k = 0
+    for from_lane in range(n_lanes):
+        if top[from_lane] < 0:
+            continue
+        for to_lane in range(n_lanes):
+            if to_lane == from_lane or free[to_lane] < 0:
+                continue
+            from_lanes[k] = from_lane
+            to_lanes[k] = to_lane
+            priorities[k] = stacks[from_lane, top[from_lane]]
+            k += 1
+    return from_lanes, to_lanes, priorities
+
+
+@_jit
+def apply_move(stacks, from_lane, to_lane, reversed=False):
+    """
+    Moves the next load of from_lane to to_lane in place.
+    Returns the priority and the changed slots, the priority is -1 if the move is not possible.
+    """
+    from_index = top_load_index(stacks, from_lane, reversed)
+    if from_index < 0 or free_slot_index(stacks, to_lane, reversed) < 0:
+        return -1, from_index, -1
+    priority = stacks[from_lane, from_index]
+    stacks[from_lane, from_index] = 0
+    to_index = free_slot_index(stacks, to_lane, reversed)
+    stacks[to_lane, to_index] = priority
+    return priority, from_index, to_index
+
+
+
+@_jit
+def apply_successor_moves(states, stacks, from_lanes, to_lanes, priorities, reversed=False):
+    """
+    Applies move k to states[k] in place, states holds a copy of stacks per move.
+    """
+    n_lanes = stacks.shape[0]
+    top = np.empty(n_lanes, dtype=np.int64)
+    free = np.empty(n_lanes, dtype=np.int64)
+    for lane in range(n_lanes):
+        top[lane] = top_load_index(stacks, lane, reversed)
+        free[lane] = free_slot_index(stacks, lane, reversed)
+
+    for k in range(len(from_lanes)):
+        states[k, from_lanes[k], top[from_lanes[k]]] = 0
+        states[k, to_lanes[k], free[to_lanes[k]]] = priorities[k]
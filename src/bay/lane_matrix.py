@@ -0,0 +1,355 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import numpy as np
+from typing import List, Tuple
+
+from src.bay import lane_kernels
+from src.bay.virtual_lane import VirtualLane
+
+# Value of the slots behind the end of a lane
+PADDING = -1
+
+# Zobrist tables by (lanes, depth, max priority), equal in all processes
+ZOBRIST_SEED = 2024
+_ZOBRIST_TABLES = {}
+
+
+def get_priority_dtype(max_priority: int):
+    """
+    Smallest integer type that holds all priorities and the padding.
+    """
+    if max_priority <= np.iinfo(np.int8).max:
+        return np.int8
+    return np.int16
+
+
+def get_zobrist_table(n_lanes: int, depth: int, max_priority: int) -> np.ndarray:
+    """
+    Random 64 bit keys for every (lane, slot, priority), empty slots have the key 0.
+    """
+    key = (n_lanes, depth, max_priority)
+    if key not in _ZOBRIST_TABLES:
+        rng = np.random.default_rng(ZOBRIST_SEED)
+        table = rng.integers(0, np.iinfo(np.uint64).max, size=(n_lanes, depth, max_priority + 1),
+                             dtype=np.uint64, endpoint=True)
+        table[:, :, 0] = 0
+        _ZOBRIST_TABLES[key] = table
+    return _ZOBRIST_TABLES[key]
+
+
+class LaneMatrix:
+    def __init__(self, stacks: np.ndarray, lengths: np.ndarray, ap_ids: np.ndarray):
+        """
+        Compact state of all virtual lanes of a warehouse.
+
+        Row i holds the stacks of lane i, ordered from the edge to the centre
+        of the bay like VirtualLane.stacks. Rows are padded with PADDING
+        behind the last slot of a lane.
+        """
+        # 2D array (lanes x max depth)
+        self.stacks = stacks
+        # number of slots per lane
+        self.lengths = lengths
+        # access point id per lane
+        self.ap_ids = ap_ids
+
+        # unsorted lanes, maintained incrementally once get_unsorted_count is used
+        self.unsorted = None
+        self.unsorted_reversed = False
+        self.unsorted_count = 0
+
+        # Zobrist hash, maintained incrementally once get_hash is used
+        self.hash = None
+        self.zobrist = None
+
+    @classmethod
+    def from_lists(cls, lanes: list, ap_ids: list, dtype=None):
+        lengths = np.array([len(lane) for lane in lanes], dtype=np.int32)
+        depth = int(lengths.max()) if len(lanes) > 0 else 0
+
+        if dtype is None:
+            max_priority = max([int(np.max(lane)) for lane in lanes if len(lane) > 0], default=0)
+            dtype = get_priority_dtype(max_priority)
+
+        stacks = np.full((len(lanes), depth), PADDING, dtype=dtype)
+        for i, lane in enumerate(lanes):
+            stacks[i, :lengths[i]] = lane
+
+        return cls(stacks, lengths, np.array(ap_ids, dtype=np.int32))
+
+    @classmethod
+    def from_virtual_lanes(cls, virtual_lanes: list, dtype=None):
+        return cls.from_lists([vl.stacks for vl in virtual_lanes],
+                              [vl.ap_id for vl in virtual_lanes],
+                              dtype)
+
+    def __len__(self):
+        return len(self.lengths)
+
+    def __eq__(self, other):
+        return (np.array_equal(self.ap_ids, other.ap_ids)
+                and np.array_equal(self.lengths, other.lengths)
+                and np.array_equal(self.stacks, other.stacks))
+
+    def copy(self):
+        # lengths and ap_ids never change, only the stacks are copied
+        lane_matrix = LaneMatrix(self.stacks.copy(), self.lengths, self.ap_ids)
+        if self.unsorted is not None:
+            lane_matrix.unsorted = self.unsorted.copy()
+            lane_matrix.unsorted_reversed = self.unsorted_reversed
+            lane_matrix.unsorted_count = self.unsorted_count
+        if self.hash is not None:
+            lane_matrix.hash = self.hash
+            lane_matrix.zobrist = self.zobrist
+        return lane_matrix
+
+    def view(self, lane: int) -> VirtualLane:
+        """
+        Returns the lane as VirtualLane sharing the memory of the matrix.
+        """
+        return VirtualLane(self.stacks[lane, :self.lengths[lane]], int(self.ap_ids[lane]))
+
+    def to_virtual_lanes(self) -> List[VirtualLane]:
+        return [self.view(i) for i in range(len(self))]
+
+    def to_lists(self) -> List[list]:
+        return [self.stacks[i, :self.lengths[i]].tolist() for i in range(len(self))]
+
+    def get_lane_index(self, ap_id: int):
+        indices = np.flatnonzero(self.ap_ids == ap_id)
+        if len(indices) == 0:
+            return None
+        return int(indices[0])
+
+    def valid_slots(self) -> np.ndarray:
+        """
+        Returns a boolean mask (lanes x max depth) of the slots that exist.
+        """
+        return np.arange(self.stacks.shape[1]) < self.lengths[:, np.newaxis]
+
+    def has_slots(self) -> np.ndarray:
+        return np.any(self.stacks == 0, axis=1)
+
+    def has_loads(self) -> np.ndarray:
+        return np.any(self.stacks > 0, axis=1)
+
+    def get_number_of_loads(self) -> np.ndarray:
+        return np.count_nonzero(self.stacks > 0, axis=1)
+
+    def top_load_indices(self, reversed=False) -> np.ndarray:
+        """
+        Returns the index of the load removed next for every lane, -1 if the lane is empty.
+        """
+        loads = self.stacks > 0
+        if reversed:
+            indices = self.stacks.shape[1] - 1 - np.argmax(loads[:, ::-1], axis=1)
+        else:
+            indices = np.argmax(loads, axis=1)
+        return np.where(np.any(loads, axis=1), indices, -1)
+
+    def free_slot_indices(self, reversed=False) -> np.ndarray:
+        """
+        Returns the index of the slot filled next for every lane, -1 if the lane is full.
+        """
+        slots = self.stacks == 0
+        if reversed:
+            indices = np.argmax(slots, axis=1)
+        else:
+            indices = self.stacks.shape[1] - 1 - np.argmax(slots[:, ::-1], axis=1)
+        return np.where(np.any(slots, axis=1), indices, -1)
+
+    def remove_load(self, lane: int, reversed=False) -> int:
+        """
+        Removes the next load of a lane in place and returns its priority.
+        """
+        if lane_kernels.USE_KERNELS:
+            index = lane_kernels.top_load_index(self.stacks, lane, reversed)
+            if index < 0:
+                raise Exception('The lane has no loads')
+        else:
+            loads = np.flatnonzero(self.stacks[lane] > 0)
+            if len(loads) == 0:
+                raise Exception('The lane has no loads')
+            index = loads[-1] if reversed else loads[0]
+        priority = int(self.stacks[lane, index])
+        self.stacks[lane, index] = 0
+        self._update_unsorted(lane)
+        self._update_hash(lane, index, priority)
+        return priority
+
+    def add_load(self, lane: int, priority: int, reversed=False):
+        """
+        Adds a load to a lane in place.
+        """
+        if lane_kernels.USE_KERNELS:
+            index = lane_kernels.free_slot_index(self.stacks, lane, reversed)
+            if index < 0:
+                raise Exception('The lane has no slots for new loads')
+        else:
+            slots = np.flatnonzero(self.stacks[lane] == 0)
+            if len(slots) == 0:
+                raise Exception('The lane has no slots for new loads')
+            index = slots[0] if reversed else slots[-1]
+        self.stacks[lane, index] = priority
+        self._update_unsorted(lane)
+        self._update_hash(lane, index, priority)
+
+    def apply_move(self, from_lane: int, to_lane: int, reversed=False) -> int:
+        """
+        Moves the next load of from_lane to to_lane in place and returns its priority.
+        """
+        if lane_kernels.USE_KERNELS:
+            priority, from_index, to_index = lane_kernels.apply_move(self.stacks, from_lane, to_lane, reversed)
+            if priority < 0:
+                raise Exception('The lane has no loads or no slots for new loads')
+            for lane, index in ((from_lane, from_index), (to_lane, to_index)):
+                self._update_unsorted(lane)
+                self._update_hash(lane, index, priority)
+            return int(priority)
+
+        if not np.any(self.stacks[to_lane] == 0):
+            raise Exception('The lane has no slots for new loads')
+        priority = self.remove_load(from_lane, reversed)
+        self.add_load(to_lane, priority, reversed)
+        return priority
+
+    def unsorted_lanes(self, reversed=False) -> np.ndarray:
+        """
+        Returns a boolean array marking the lanes with blocking loads.
+        A lane is sorted if its priorities never decrease from the edge to the centre.
+        """
+        if reversed:
+            decreasing = self.stacks[:, 1:] > self.stacks[:, :-1]
+        else:
+            decreasing = self.stacks[:, 1:] < self.stacks[:, :-1]
+        # compare only pairs of slots inside the lane
+        return np.any(decreasing & self.valid_slots()[:, 1:], axis=1)
+
+    def get_virtual_lane_score(self, reversed=False) -> int:
+        """
+        Vectorised version of eoh_util.get_virtual_lane_score.
+        """
+        return int(np.count_nonzero(self.unsorted_lanes(reversed)))
+
+    def is_lane_unsorted(self, lane: int, reversed=False) -> bool:
+        if lane_kernels.USE_KERNELS:
+            return bool(lane_kernels.is_lane_unsorted(self.stacks, self.lengths, lane, reversed))
+        stacks = self.stacks[lane, :self.lengths[lane]]
+        if reversed:
+            return bool(np.any(stacks[1:] > stacks[:-1]))
+        return bool(np.any(stacks[1:] < stacks[:-1]))
+
+    def get_unsorted_count(self, reversed=False) -> int:
+        """
+        Returns the number of unsorted lanes. The first call computes it for all
+        lanes, afterwards only the lanes changed by remove_load/add_load are
+        checked again.
+        """
+        if self.unsorted is None or self.unsorted_reversed != reversed:
+            self.unsorted = self.unsorted_lanes(reversed)
+            self.unsorted_reversed = reversed
+            self.unsorted_count = int(np.count_nonzero(self.unsorted))
+        return self.unsorted_count
+
+    def _update_unsorted(self, lane: int):
+        if self.unsorted is None:
+            return
+        unsorted = self.is_lane_unsorted(lane, self.unsorted_reversed)
+        self.unsorted_count += int(unsorted) - int(self.unsorted[lane])
+        self.unsorted[lane] = unsorted
+
+    def canonical_order(self) -> np.ndarray:
+        """
+        Lane order by ap_id, independent of the order the lanes were created in.
+        """
+        return np.argsort(self.ap_ids, kind="stable")
+
+    def to_bytes(self) -> bytes:
+        """
+        Canonical packed encoding of the state: the stacks (int16, padded) of
+        the lanes ordered by ap_id. Equal states of the same warehouse give
+        equal bytes, independent of the dtype and lane order of the matrix.
+        """
+        return np.ascontiguousarray(self.stacks[self.canonical_order()], dtype="<i2").tobytes()
+
+    def get_hash(self) -> int:
+        """
+        Returns the Zobrist hash of the state. The first call computes it,
+        afterwards remove_load/add_load update it in O(1).
+        """
+        if self.hash is None:
+            max_priority = int(max(self.stacks.max(initial=0), 1))
+            table = get_zobrist_table(len(self), self.stacks.shape[1], max_priority)
+            # keys of the lanes in canonical order
+            rank = np.empty(len(self), dtype=np.intp)
+            rank[self.canonical_order()] = np.arange(len(self))
+            self.zobrist = table[rank]
+
+            loads = self.stacks > 0
+            lanes, slots = np.nonzero(loads)
+            self.hash = int(np.bitwise_xor.reduce(self.zobrist[lanes, slots, self.stacks[loads]],
+                                                  initial=np.uint64(0)))
+        return self.hash
+
+    def get_successor_hashes(self, from_lanes: np.ndarray, to_lanes: np.ndarray,
+                             priorities: np.ndarray, reversed=False) -> np.ndarray:
+        """
+        Zobrist hashes of the states after the moves (see get_moves), without applying them.
+        """
+        base = np.uint64(self.get_hash())
+        top = self.top_load_indices(reversed)[from_lanes]
+        free = self.free_slot_indices(reversed)[to_lanes]
+        return (base ^ self.zobrist[from_lanes, top, priorities]
+                ^ self.zobrist[to_lanes, free, priorities])
+
+    def _update_hash(self, lane: int, index: int, priority: int):
+        if self.hash is None:
+            return
+        if priority >= self.zobrist.shape[2]:
+            # a new priority class, the next get_hash computes the hash again
+            self.hash = None
+            return
+        self.hash ^= int(self.zobrist[lane, index, priority])
+
+    def get_moves(self, reversed=False) -> Tuple[np.ndarray, np.ndarray, np.ndarray]:
+        """
+        Returns all moves from a lane with loads to another lane with free slots
+        as arrays of from-lane indices, to-lane indices and moved priorities.
+        The order matches eoh_util.create_lanes.
+        """
+        if lane_kernels.USE_KERNELS:
+            return lane_kernels.get_moves(self.stacks, reversed)
+
+        from_lanes = np.flatnonzero(self.has_loads())
+        to_lanes = np.flatnonzero(self.has_slots())
+
+        from_index = np.repeat(from_lanes, len(to_lanes))
+        to_index = np.tile(to_lanes, len(from_lanes))
+        different = from_index != to_index
+        from_index = from_index[different]
+        to_index = to_index[different]
+
+        top = self.top_load_indices(reversed)
+        priorities = self.stacks[from_index, top[from_index]]
+        return from_index, to_index, priorities
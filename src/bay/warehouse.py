@@ -21,15 +21,19 @@
 # SOFTWARE.
 
 
+import os
+import copy
 import numpy as np
 from typing import List
 
 from src.bay.access_bay import AccessBay
 from src.bay.access_point import AccessPoint
-from src.preprocessing.layout_to_bays import layout_to_bays
+from src.bay.lane_matrix import LaneMatrix
+from src.bay.virtual_lane import VirtualLane
+from src.preprocessing.layout_to_bays import layout_to_bays, get_layout_path
 from src.util.access_util import next_in_direction
 from src.util.graph_distance_estimator import edges_to_neighbors
-from src.util.graph_distance_estimator import estimate_distances_bfs
+from src.util.graph_distance_estimator import AccessPointDistances
 
 class Warehouse:
     def __init__(self, filename: str, access_directions : dict):
@@ -41,16 +45,24 @@ class Warehouse:
         self.bays = dictionary["bays"]
         self.path_nodes = dictionary["path_nodes"]
         self.edges = dictionary["edges"]
+        # (indptr, indices) adjacency over the indices of path_nodes
+        self.path_csr = dictionary["path_csr"]
         self.length = dictionary["length"]
         self.width = dictionary["width"]
         self.sinks = dictionary["sinks"]
         self.sources = dictionary["sources"]
         self.neighbors = edges_to_neighbors(self.edges)
 
-        # Only used in viz
-        self.ap_distance = estimate_distances_bfs(self.unpack_access_points(), self.neighbors)
+        # Only used in viz, computed on first access and shared by all copies
+        layout_file = get_layout_path(filename)
+        self.ap_distance_service = AccessPointDistances(
+            self.unpack_access_points(), self.path_nodes, self.path_csr,
+            cache_file=self.get_distance_cache_file(layout_file, access_directions),
+            layout_file=layout_file)
 
         self.virtual_lanes = None
+        # set on copies, which share bays, sinks, sources and access points until read_lanes writes them
+        self.layout_shared = False
 
         self.all_access_points = []
         ap_id_offset = 0
@@ -75,6 +87,40 @@ class Warehouse:
                     sink.access_points[i].ap_id = i + ap_id_offset
                 ap_id_offset += len(sink.access_points)
         
+    @property
+    def ap_distance(self) -> np.ndarray:
+        return self.ap_distance_service.get_matrix()
+
+    @staticmethod
+    def get_distance_cache_file(layout_file: str, access_directions: dict) -> str:
+        """
+        Returns the .npy file next to the layout that stores the access point distances.
+        """
+        directions = "".join(str(int(access_directions[d])) for d in ["north", "east", "south", "west"])
+        return f"{os.path.splitext(layout_file)[0]}_ap_distance_{directions}.npy"
+
+    def copy(self):
+        """
+        Returns a copy which shares the layout with this warehouse, only the
+        virtual lanes are copied. Bays, sinks, sources and access points are
+        copied by either warehouse on the first write of their state, see read_lanes.
+        """
+        warehouse = copy.copy(self)
+        self.layout_shared = True
+        warehouse.layout_shared = True
+        if self.virtual_lanes is not None:
+            warehouse.virtual_lanes = [VirtualLane(vl.stacks.copy(), vl.ap_id) for vl in self.virtual_lanes]
+        return warehouse
+
+    def own_layout(self):
+        """
+        Copies the bays, sinks, sources and access points shared with other warehouses.
+        """
+        if self.layout_shared:
+            self.sources, self.bays, self.sinks, self.all_access_points = copy.deepcopy(
+                (self.sources, self.bays, self.sinks, self.all_access_points))
+            self.layout_shared = False
+
     def __apply_move(self, move: tuple):
         remove_i, _ = self.get_vl_index_for_ap(move[0])
         add_i, _ = self.get_vl_index_for_ap(move[1])
@@ -146,6 +192,7 @@ class Warehouse:
         self.read_lanes(self.virtual_lanes)
 
     def read_lanes(self, lanes):
+        self.own_layout()
         for lane in lanes:
             ap: AccessPoint = self.all_access_points[lane.ap_id]
             bay: AccessBay = ap.bay
@@ -156,6 +203,22 @@ class Warehouse:
                 bay.state[stack] = lane.stacks[start:end]
                 stack = next_in_direction(bay, stack, ap.direction)
 
+    def get_lane_matrix(self, dtype=None) -> LaneMatrix:
+        """
+        Returns a copy of the virtual lanes as a compact LaneMatrix.
+        """
+        if self.virtual_lanes is None:
+            raise Exception('No virtual lanes in warehouse! Object is None')
+
+        return LaneMatrix.from_virtual_lanes(self.virtual_lanes, dtype)
+
+    def set_lane_matrix(self, lane_matrix: LaneMatrix):
+        """
+        Uses the lanes of the matrix as virtual lanes. The VirtualLane objects
+        are views on the matrix, changes to the matrix are visible in the lanes.
+        """
+        self.virtual_lanes = lane_matrix.to_virtual_lanes()
+
     def get_ap_from_vl(self, point: int):
         return self.virtual_lanes[point].ap_id
 
@@ -0,0 +1,69 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+from collections import OrderedDict
+
+from src.bay.warehouse import Warehouse
+
+# Number of layouts kept per process
+DEFAULT_CACHE_SIZE = 32
+
+
+class WarehouseCache:
+    def __init__(self, max_size: int = DEFAULT_CACHE_SIZE):
+        """
+        Least recently used cache of parsed warehouse layouts.
+
+        A layout is parsed once per (layout file, access directions), every
+        request returns a copy that can be filled with its own virtual lanes.
+        """
+        self.max_size = max_size
+        self.warehouses = OrderedDict()
+
+    def get(self, filename: str, access_directions: dict) -> Warehouse:
+        key = (filename, tuple(sorted(access_directions.items())))
+
+        warehouse = self.warehouses.get(key)
+        if warehouse is None:
+            warehouse = Warehouse(filename, access_directions)
+            self.warehouses[key] = warehouse
+            if len(self.warehouses) > self.max_size:
+                self.warehouses.popitem(last=False)
+        else:
+            self.warehouses.move_to_end(key)
+
+        return warehouse.copy()
+
+    def clear(self):
+        self.warehouses.clear()
+
+
+# Cache shared by all evaluations of this process
+WAREHOUSE_CACHE = WarehouseCache()
+
+
+def get_warehouse(filename: str, access_directions: dict) -> Warehouse:
+    """
+    Returns an empty warehouse for the layout from the process wide cache.
+    """
+    return WAREHOUSE_CACHE.get(filename, access_directions)
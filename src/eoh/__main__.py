@@ -22,6 +22,7 @@
 
 
 import os
+import time
 import json
 import click
 import logging
@@ -126,3 +127,52 @@ def run(problem, model_name, use_example):
 
     # run
     evolution.run()
+
+
+@main.command()
+@click.argument("instance_path")
+@click.option('--output', default="reference_moves.json", help='File for the results of all instances')
+@click.option('--algorithm', default="astar", type=click.Choice(["astar", "idastar"]), help='Search algorithm')
+@click.option('--weight', default=1.0, help='Weight of the lower bound for A*, 1 is optimal')
+@click.option('--node_budget', default=None, type=int, help='Max expanded states per instance')
+@click.option('--time_budget', default=None, type=float, help='Max seconds per instance')
+@click.option('--n_jobs', default=-1, help='Number of parallel processes')
+@click.option('--reference_key', default=None, help='Store the moves under this key in the instance files')
+def reference(instance_path, output, algorithm, weight, node_budget, time_budget, n_jobs, reference_key):
+    """Computes optimal or bounded-suboptimal reference move counts for all instances of a directory."""
+    from src.util.reshuffle_search import solve_instance_directory
+
+    results = solve_instance_directory(instance_path, n_jobs=n_jobs, reference_key=reference_key,
+                                       algorithm=algorithm, weight=weight,
+                                       node_budget=node_budget, time_budget=time_budget)
+
+    for filename, result in results.items():
+        print(f"{filename}: {result['status']}, moves: {result['moves']}, "
+              f"lower bound: {result['lower_bound']}, time: {result['time']:.2f} s")
+
+    with open(output, 'w+') as f:
+        json.dump(results, f, indent=5)
+
+
+@main.command()
+@click.argument("instance_path")
+@click.option('--pack_path', default=None, help='Pack directory, default instance_path/instance_pack')
+def pack(instance_path, pack_path):
+    """Compiles the instance files of a directory into a memory-mapped pack used by load_experiments."""
+    from src.util.instance_pack import build_instance_pack
+
+    start_time = time.time()
+    n_instances = build_instance_pack(instance_path, pack_path)
+    print(f"Packed {n_instances} instances in {time.time() - start_time:.2f} s")
+
+
+@main.command()
+@click.argument("pickle_files", nargs=-1)
+@click.option('--dataset_path', required=True, help='Directory of the converted datasets (eva_bp_dataset_path)')
+def bp_datasets(pickle_files, dataset_path):
+    """Converts pickles of Weibull bin packing instances into memory-mapped datasets."""
+    from src.eoh.problems.optimization.bp_online.get_instance import convert_dataset_file
+
+    for pickle_file in pickle_files:
+        names = convert_dataset_file(pickle_file, dataset_path)
+        print(f"{pickle_file}: {', '.join(names)}")
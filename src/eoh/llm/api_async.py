@@ -0,0 +1,301 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import abc
+import time
+import atexit
+import random
+import asyncio
+import logging
+import threading
+
+import aiohttp
+import numpy as np
+
+# Status codes which are retried with backoff
+RETRY_STATUS = {408, 429, 500, 502, 503, 504}
+
+
+class LLMMetrics:
+    def __init__(self):
+        """
+        Request latency and token throughput of a client, safe to update from the event loop thread.
+        """
+        self.lock = threading.Lock()
+        self.start_time = time.perf_counter()
+        self.latencies = []
+        self.n_failed = 0
+        self.n_retries = 0
+        self.prompt_tokens = 0
+        self.completion_tokens = 0
+
+    def record(self, latency, prompt_tokens, completion_tokens):
+        with self.lock:
+            self.latencies.append(latency)
+            self.prompt_tokens += prompt_tokens
+            self.completion_tokens += completion_tokens
+
+    def record_retry(self):
+        with self.lock:
+            self.n_retries += 1
+
+    def record_failure(self):
+        with self.lock:
+            self.n_failed += 1
+
+    def get_metrics(self):
+        with self.lock:
+            latencies = np.array(self.latencies)
+            elapsed = time.perf_counter() - self.start_time
+            metrics = {
+                'requests': len(latencies),
+                'failed': self.n_failed,
+                'retries': self.n_retries,
+                'prompt_tokens': self.prompt_tokens,
+                'completion_tokens': self.completion_tokens,
+                'completion_tokens_per_second': self.completion_tokens / elapsed if elapsed > 0 else 0.0,
+            }
+        if len(latencies) > 0:
+            metrics.update({
+                'latency_mean': float(np.mean(latencies)),
+                'latency_p50': float(np.percentile(latencies, 50)),
+                'latency_p95': float(np.percentile(latencies, 95)),
+            })
+        return metrics
+
+
+class _SharedLoop:
+    def __init__(self):
+        """
+        Event loop in a background thread with one session per endpoint,
+        shared by all clients of a process. Unpickled copies of a client in
+        a worker process reuse the loop and the connections of that worker.
+        """
+        self.lock = threading.Lock()
+        self.loop = None
+        self.thread = None
+        # (url, headers, max_in_flight) -> (session, semaphore), only used in the loop thread
+        self.sessions = {}
+        self.metrics = {}
+
+    def get_loop(self):
+        with self.lock:
+            if self.loop is None:
+                self.loop = asyncio.new_event_loop()
+                self.thread = threading.Thread(target=self.loop.run_forever, daemon=True)
+                self.thread.start()
+            return self.loop
+
+    def get_metrics(self, key) -> LLMMetrics:
+        with self.lock:
+            if key not in self.metrics:
+                self.metrics[key] = LLMMetrics()
+            return self.metrics[key]
+
+    async def get_session(self, key, headers, max_in_flight, request_timeout):
+        if key not in self.sessions:
+            connector = aiohttp.TCPConnector(limit=max_in_flight, keepalive_timeout=60)
+            session = aiohttp.ClientSession(connector=connector, headers=headers,
+                                            timeout=aiohttp.ClientTimeout(total=request_timeout))
+            self.sessions[key] = (session, asyncio.Semaphore(max_in_flight))
+        return self.sessions[key]
+
+    async def close_session(self, key):
+        if key in self.sessions:
+            session, _ = self.sessions.pop(key)
+            await session.close()
+
+    async def close_sessions(self):
+        for key in list(self.sessions):
+            await self.close_session(key)
+
+    def run(self, coroutine):
+        return asyncio.run_coroutine_threadsafe(coroutine, self.get_loop()).result()
+
+    def close(self):
+        with self.lock:
+            loop, thread = self.loop, self.thread
+            self.loop = None
+            self.thread = None
+        if loop is None:
+            return
+        asyncio.run_coroutine_threadsafe(self.close_sessions(), loop).result()
+        loop.call_soon_threadsafe(loop.stop)
+        thread.join()
+        loop.close()
+
+
+_shared_loop = _SharedLoop()
+atexit.register(_shared_loop.close)
+
+
+class AsyncLLMClient(abc.ABC):
+    def __init__(self, url, headers, max_in_flight=8, n_trial=5,
+                 backoff_base=1.0, backoff_max=60.0, request_timeout=600.0):
+        """
+        Sends prompts over a keep-alive connection pool.
+
+        The event loop runs in a background thread, so get_response can be
+        called from synchronous code and from several threads. The loop and
+        the connections are shared by all clients of a process with the
+        same endpoint (see _SharedLoop) and closed at exit. At most
+        max_in_flight requests are sent at once, 429/5xx responses and
+        connection errors are retried with exponential backoff and jitter.
+
+        The limit only holds for the requests of one process, the offspring
+        are therefore created in threads when the client is used (see
+        Paras.set_evaluation). Subclasses implement build_payload and parse_response.
+        """
+        self.url = url
+        self.headers = headers
+        self.max_in_flight = max_in_flight
+        self.n_trial = n_trial
+        self.backoff_base = backoff_base
+        self.backoff_max = backoff_max
+        self.request_timeout = request_timeout
+
+    def get_key(self):
+        return self.url, tuple(sorted(self.headers.items())), self.max_in_flight
+
+    @abc.abstractmethod
+    def build_payload(self, prompt_content: str) -> dict:
+        """
+        Request body of a prompt.
+        """
+
+    @abc.abstractmethod
+    def parse_response(self, json_data: dict):
+        """
+        Returns the text, the prompt tokens and the completion tokens.
+        """
+
+    def _get_backoff(self, trial, retry_after=None):
+        if retry_after is not None:
+            try:
+                return min(float(retry_after), self.backoff_max)
+            except ValueError:
+                pass
+        # full jitter
+        return random.uniform(0, min(self.backoff_max, self.backoff_base * 2 ** trial))
+
+    async def _request(self, prompt_content: str):
+        key = self.get_key()
+        session, semaphore = await _shared_loop.get_session(key, self.headers, self.max_in_flight,
+                                                            self.request_timeout)
+        metrics = _shared_loop.get_metrics(key)
+        payload = self.build_payload(prompt_content)
+
+        json_data = None
+        for trial in range(self.n_trial):
+            retry_after = None
+            async with semaphore:
+                start_time = time.perf_counter()
+                try:
+                    async with session.post(self.url, json=payload) as res:
+                        if res.status == 200:
+                            json_data = await res.json(content_type=None)
+                            response, prompt_tokens, completion_tokens = self.parse_response(json_data)
+                            metrics.record(time.perf_counter() - start_time, prompt_tokens, completion_tokens)
+                            return response, json_data
+                        if res.status not in RETRY_STATUS:
+                            print(f"[HTTP] ERROR CODE: {res.status}")
+                            logging.info(f"[HTTP-Async] ERROR CODE: {res.status} {await res.text()}")
+                            break
+                        retry_after = res.headers.get("Retry-After")
+                        print(f"[HTTP] ERROR CODE: {res.status}, retry...")
+                except (aiohttp.ClientError, asyncio.TimeoutError, KeyError, IndexError, TypeError, ValueError) as e:
+                    print(f"[HTTP] Failed: {e!r}, retry...")
+
+            metrics.record_retry()
+            await asyncio.sleep(self._get_backoff(trial, retry_after))
+
+        metrics.record_failure()
+        return None, json_data
+
+    def get_response(self, prompt_content: str):
+        return _shared_loop.run(self._request(prompt_content))
+
+    def get_metrics(self):
+        """
+        Metrics of the requests to this endpoint sent by this process.
+        """
+        return _shared_loop.get_metrics(self.get_key()).get_metrics()
+
+    def close(self):
+        if _shared_loop.loop is not None:
+            _shared_loop.run(_shared_loop.close_session(self.get_key()))
+
+
+class AsyncInterfaceAPI(AsyncLLMClient):
+    def __init__(self, api_endpoint, api_key, model_LLM, temperature, llm_url_info, **kwargs):
+        """
+        Chat completions API, same requests as InterfaceAPI.
+        """
+        headers = {
+            "Authorization": "Bearer " + api_key,
+            "Content-Type": "application/json",
+            "x-api2d-no-cache": "1"
+        }
+        super().__init__(f"https://{api_endpoint}{llm_url_info}", headers, **kwargs)
+        self.model_LLM = model_LLM
+        self.temperature = temperature
+
+    def build_payload(self, prompt_content):
+        payload = {
+            "model": self.model_LLM,
+            "messages": [
+                {"role": "user", "content": prompt_content}
+            ],
+            "stream": False,
+        }
+        if self.temperature is not None:
+            payload["temperature"] = self.temperature
+        return payload
+
+    def parse_response(self, json_data):
+        usage = json_data.get("usage") or {}
+        return (json_data["choices"][0]["message"]["content"],
+                usage.get("prompt_tokens", 0), usage.get("completion_tokens", 0))
+
+
+class AsyncInterfaceLocalLLM(AsyncLLMClient):
+    def __init__(self, url, model, temperature, **kwargs):
+        """
+        Local generate API, same requests as InterfaceLocalLLM.
+        """
+        super().__init__(url, {'Content-Type': 'application/json'}, **kwargs)
+        self.model = model
+        self.temperature = temperature
+
+    def build_payload(self, prompt_content):
+        payload = {
+            "prompt": prompt_content.strip('\n').strip(),
+            "model": self.model,
+            "stream": False,
+        }
+        if self.temperature is not None:
+            payload["temperature"] = self.temperature
+        return payload
+
+    def parse_response(self, json_data):
+        return (json_data['response'],
+                json_data.get("prompt_eval_count", 0), json_data.get("eval_count", 0))
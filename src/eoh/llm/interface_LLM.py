@@ -28,7 +28,8 @@ from ..llm.api_local_llm import InterfaceLocalLLM
 class InterfaceLLM:
     def __init__(self, api_endpoint, api_key, 
                  model_LLM, llm_use_local, llm_local_url, 
-                 debug_mode, llm_temperature, llm_url_info):
+                 debug_mode, llm_temperature, llm_url_info,
+                 llm_async = False, llm_max_in_flight = 8):
         
         
         self.api_endpoint = api_endpoint
@@ -39,6 +40,8 @@ class InterfaceLLM:
         self.llm_local_url = llm_local_url
         self.llm_temperature = llm_temperature
         self.llm_url_info = llm_url_info
+        self.llm_async = llm_async
+        self.llm_max_in_flight = llm_max_in_flight
 
         print("- check LLM API")
 
@@ -49,11 +52,20 @@ class InterfaceLLM:
                 print(">> Stop with empty url for local llm !")
                 exit()
 
-            self.interface_llm = InterfaceLocalLLM(
-                self.llm_local_url,
-                self.model_LLM,
-                self.llm_temperature,
-            )
+            if self.llm_async:
+                from ..llm.api_async import AsyncInterfaceLocalLLM
+                self.interface_llm = AsyncInterfaceLocalLLM(
+                    self.llm_local_url,
+                    self.model_LLM,
+                    self.llm_temperature,
+                    max_in_flight=self.llm_max_in_flight,
+                )
+            else:
+                self.interface_llm = InterfaceLocalLLM(
+                    self.llm_local_url,
+                    self.model_LLM,
+                    self.llm_temperature,
+                )
 
         else:
             print('remote llm api is used ...')
@@ -64,14 +76,25 @@ class InterfaceLLM:
                 print(">> Stop with wrong API setting: Set api_endpoint (e.g., api.chat...) and api_key (e.g., kx-...) !")
                 exit()
 
-            self.interface_llm = InterfaceAPI(
-                self.api_endpoint,
-                self.api_key,
-                self.model_LLM,
-                self.debug_mode,
-                self.llm_temperature,
-                self.llm_url_info
-            )
+            if self.llm_async:
+                from ..llm.api_async import AsyncInterfaceAPI
+                self.interface_llm = AsyncInterfaceAPI(
+                    self.api_endpoint,
+                    self.api_key,
+                    self.model_LLM,
+                    self.llm_temperature,
+                    self.llm_url_info,
+                    max_in_flight=self.llm_max_in_flight,
+                )
+            else:
+                self.interface_llm = InterfaceAPI(
+                    self.api_endpoint,
+                    self.api_key,
+                    self.model_LLM,
+                    self.debug_mode,
+                    self.llm_temperature,
+                    self.llm_url_info
+                )
 
             
         res = self.interface_llm.get_response("1+1=?")
@@ -83,7 +106,14 @@ class InterfaceLLM:
 
     def get_response(self, prompt_content):
         response, json_data = self.interface_llm.get_response(prompt_content)
+        return self.check_response(response, json_data)
 
+    def get_metrics(self):
+        if hasattr(self.interface_llm, "get_metrics"):
+            return self.interface_llm.get_metrics()
+        return None
+
+    def check_response(self, response, json_data):
         if response is None:
             print("XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX")
             print("[API ERROR]: Response is None")
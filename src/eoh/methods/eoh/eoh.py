@@ -27,8 +27,11 @@ import time
 import json
 import random
 import numpy as np
+import concurrent.futures
+from datetime import datetime
 
 from .eoh_interface_EC import InterfaceEC
+from src.eoh.utils.fitness_cache import FITNESS_CACHE_FILE
 from src.eoh.utils.visualizeResults import *
 from src.eoh.utils.visualizePromptFrequency import *
 
@@ -84,14 +87,33 @@ class EOH:
         self.result_folder_name = os.environ["CURRENT_EXPERIMENT"]
 
         self.exp_n_proc = paras.exp_n_proc
+        self.pipeline = paras.exp_pipeline
+        self.pipeline_queue_size = paras.exp_pipeline_queue_size
+        self.steady_state = paras.exp_steady_state
+        self.steady_state_in_flight = paras.exp_steady_state_in_flight or paras.exp_n_proc
         
         self.timeout = paras.eva_timeout
 
         self.use_numba = paras.eva_numba_decorator
 
+        self.early_abort = paras.eva_early_abort
+
+        self.use_pool = paras.eva_use_pool
+        self.pool_memory_limit = paras.eva_pool_memory_limit
+
+        self.fitness_cache_path = None
+        if paras.eva_fitness_cache:
+            # continued runs share the cache of the original experiment
+            cache_folder = self.result_folder_name
+            if self.load_pop:
+                cache_folder = os.path.join(self.output_path, paras.exp_continue_folder)
+            self.fitness_cache_path = os.path.join(cache_folder, FITNESS_CACHE_FILE)
+
         self.use_example = paras.ec_use_example
 
         self.llm_url_info = paras.llm_url_info
+        self.llm_async = paras.llm_async
+        self.llm_max_in_flight = paras.llm_max_in_flight
 
         print("- EoH parameters loaded -")
 
@@ -122,7 +144,11 @@ class EOH:
         interface_ec = InterfaceEC(self.pop_size, self.m, self.api_endpoint, self.api_key, self.llm_model, self.use_local_llm, self.llm_local_url,
                                    self.debug_mode, interface_prob, select=self.select,n_p=self.exp_n_proc,
                                    timeout = self.timeout, use_numba=self.use_numba, use_example=self.use_example, llm_temperature = self.llm_temperature,
-                                   llm_url_info=self.llm_url_info)
+                                   llm_url_info=self.llm_url_info, early_abort=self.early_abort,
+                                   use_pool=self.use_pool, pool_memory_limit=self.pool_memory_limit,
+                                   fitness_cache_path=self.fitness_cache_path,
+                                   pipeline=self.pipeline, pipeline_queue_size=self.pipeline_queue_size,
+                                   llm_async=self.llm_async, llm_max_in_flight=self.llm_max_in_flight)
 
         # initialization
         population = []
@@ -161,6 +187,11 @@ class EOH:
                     json.dump(population, f, indent=5)
                 n_start = 0
 
+        if self.steady_state:
+            self.run_steady_state(interface_ec, population, n_start, time_start)
+            interface_ec.close()
+            return
+
         # main loop
         n_op = len(self.operators)
 
@@ -181,22 +212,80 @@ class EOH:
                 print()
 
 
-            # Save population to a file
-            filename = self.result_folder_name + "/pops/population_generation_" + str(pop + 1) + ".json"
-            with open(filename, 'w+') as f:
-                json.dump(population, f, indent=5)
+            self.save_population(population, pop + 1, time_start)
 
-            # Save the best one to a file
-            filename = self.result_folder_name + "/pops_best/population_generation_" + str(pop + 1) + ".json"
-            with open(filename, 'w+') as f:
-                json.dump(population[0], f, indent=5)
+        interface_ec.close()
+
+    def save_population(self, population, generation, time_start):
+
+        # Save population to a file
+        filename = self.result_folder_name + "/pops/population_generation_" + str(generation) + ".json"
+        with open(filename, 'w+') as f:
+            json.dump(population, f, indent=5)
 
+        # Save the best one to a file
+        filename = self.result_folder_name + "/pops_best/population_generation_" + str(generation) + ".json"
+        with open(filename, 'w+') as f:
+            json.dump(population[0], f, indent=5)
 
-            print(f"--- {pop + 1} of {self.n_pop} populations finished. Time Cost:  {((time.time()-time_start)/60):.1f} m")
-            print("Pop Objs: ", end=" ")
-            for i in range(len(population)):
-                print(str(population[i]['objective']) + " ", end="")
-            print()
-            load_and_plot_objective_ranges(self.result_folder_name)
-            plot_evaluation_time(self.result_folder_name)
+
+        print(f"--- {generation} of {self.n_pop} populations finished. Time Cost:  {((time.time()-time_start)/60):.1f} m")
+        print("Pop Objs: ", end=" ")
+        for i in range(len(population)):
+            print(str(population[i]['objective']) + " ", end="")
+        print()
+        load_and_plot_objective_ranges(self.result_folder_name)
+        plot_evaluation_time(self.result_folder_name)
+
+    def next_operator(self, n_submitted):
+        """
+        Operators in the order of run, each one is applied with the probability of its weight.
+        """
+        n_op = len(self.operators)
+        for i in range(n_submitted, n_submitted + 100 * n_op):
+            if np.random.rand() < self.operator_weights[i % n_op]:
+                return self.operators[i % n_op]
+        return self.operators[n_submitted % n_op]
+
+    def run_steady_state(self, interface_ec, population, n_start, time_start):
+        """
+        Steady-state evolution: every finished offspring enters the population
+        immediately and new requests select their parents from the current
+        population. At most steady_state_in_flight offspring are created at
+        once. The same number of offspring as in run is created and the
+        population is saved after every pop_size * operators offspring.
+        """
+        n_per_generation = self.pop_size * len(self.operators)
+        n_total = self.n_pop * n_per_generation
+        time_str = datetime.now().strftime("%y%m%d_%H%M%S")
+
+        n_submitted = 0
+        n_finished = 0
+        generation = n_start
+        in_flight = {}
+
+        with concurrent.futures.ThreadPoolExecutor(max_workers=self.steady_state_in_flight) as executor:
+            while n_finished < n_total:
+
+                while n_submitted < n_total and len(in_flight) < self.steady_state_in_flight:
+                    op = self.next_operator(n_submitted)
+                    future = executor.submit(interface_ec.get_offspring, list(population), op,
+                                             f'pop_{generation}_op_{op}_n{n_submitted}_{time_str}')
+                    in_flight[future] = op
+                    n_submitted += 1
+
+                done, _ = concurrent.futures.wait(in_flight, return_when=concurrent.futures.FIRST_COMPLETED)
+                for future in done:
+                    op = in_flight.pop(future)
+                    _, offspring = future.result()
+                    print(f" OP: {op}, Obj: {offspring['objective']}")
+
+                    self.add2pop(population, [offspring])
+                    size_act = min(len(population), self.pop_size)
+                    population = self.manage.population_management(population, size_act)
+
+                    n_finished += 1
+                    if n_finished % n_per_generation == 0:
+                        generation += 1
+                        self.save_population(population, generation, time_start)
 
@@ -63,7 +63,9 @@ class Evolution():
         self.debug_mode = debug_mode  # close prompt checking
 
         self.interface_llm = InterfaceLLM(self.api_endpoint, self.api_key, self.model_LLM, llm_use_local, llm_local_url,
-                                          self.debug_mode, self.llm_temperature, self.llm_url_info)
+                                          self.debug_mode, self.llm_temperature, self.llm_url_info,
+                                          llm_async=kwargs.get('llm_async', False),
+                                          llm_max_in_flight=kwargs.get('llm_max_in_flight', 8))
 
 
     def get_prompt_i1(self):
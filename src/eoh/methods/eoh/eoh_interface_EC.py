@@ -30,7 +30,10 @@ from .eoh_evolution import Evolution
 import warnings
 from joblib import Parallel, delayed
 from .evaluator_accelerate import add_numba_decorator
+from .evaluation_pool import EvaluationPool
+from src.eoh.utils.fitness_cache import FitnessCache, get_problem_fingerprint
 import re
+import queue
 import concurrent.futures
 
 import os
@@ -47,7 +50,9 @@ class InterfaceEC():
                  llm_model, llm_use_local, llm_local_url, 
                  debug_mode, interface_prob, select, n_p, timeout, 
                  use_numba = False, use_example = True, llm_temperature = None, 
-                 llm_url_info = "", **kwargs):
+                 llm_url_info = "", early_abort = False, use_pool = False,
+                 pool_memory_limit = None, fitness_cache_path = None,
+                 pipeline = False, pipeline_queue_size = None, **kwargs):
 
         self.detailed_output = os.environ["DETAILED_OUTPUT"] == 'True'
 
@@ -74,6 +79,21 @@ class InterfaceEC():
         
         self.timeout = timeout
         self.use_numba = use_numba
+        self.early_abort = early_abort
+
+        # Persistent worker processes, the offspring are then created in threads
+        self.eval_pool = None
+        if use_pool:
+            self.eval_pool = EvaluationPool(interface_prob, n_p, timeout, pool_memory_limit)
+        self.parallel_backend = 'threading' if self.eval_pool is not None else None
+
+        # LLM requests and evaluations overlap, see get_algorithm_pipelined
+        self.pipeline = pipeline and self.eval_pool is not None
+        self.pipeline_queue_size = pipeline_queue_size or 2 * n_p
+
+        self.fitness_cache = None
+        if fitness_cache_path is not None:
+            self.fitness_cache = FitnessCache(fitness_cache_path, get_problem_fingerprint(interface_prob))
 
         self.save_file_folder = os.path.join(os.environ["CURRENT_EXPERIMENT"], 'all_programs')
 
@@ -98,6 +118,23 @@ class InterfaceEC():
                 return True
         return False
 
+    def close(self):
+        llm_metrics = self.evol.interface_llm.get_metrics()
+        if llm_metrics is not None:
+            print(f"LLM requests: {llm_metrics}")
+        if self.eval_pool is not None:
+            print(f"Evaluation pool: {self.eval_pool.get_stats()}")
+            self.eval_pool.shutdown()
+
+    def get_worst_objective(self, population):
+        """
+        Objective an offspring must beat to stay in a full population, None otherwise.
+        """
+        objectives = [ind['objective'] for ind in population if ind['objective'] is not None]
+        if len(objectives) < self.pop_size:
+            return None
+        return max(objectives)
+
     def population_generation(self):
         
         n_create = 2
@@ -179,10 +216,22 @@ class InterfaceEC():
         return parents, offspring, prompt, full_res
 
     def get_offspring(self, pop, operator, save_file=""):
-
-        possible_exception = ""
-        elapsed_time = None
-        detailed_scores = None
+        generated = self.generate_offspring(pop, operator)
+        return self.evaluate_offspring(pop, generated, save_file)
+
+    def generate_offspring(self, pop, operator):
+        """
+        LLM part of get_offspring: requests, parses and prepares the code of an offspring.
+        An exception is stored in the result and reported by evaluate_offspring.
+        """
+        generated = {
+            'p': None,
+            'offspring': None,
+            'code': None,
+            'prompt': None,
+            'full_res': None,
+            'exception': ""
+        }
 
         try:
 
@@ -231,24 +280,74 @@ class InterfaceEC():
                 if n_retry > 1:
                     break
 
+            generated.update(p=p, offspring=offspring, code=code, prompt=prompt, full_res=full_res)
+
+        except Exception as e:
+            generated['exception'] = e
+
+        return generated
+
+    def evaluate_offspring(self, pop, generated, save_file=""):
+        """
+        Evaluation part of get_offspring, also saves the program file.
+        """
+        possible_exception = generated['exception']
+        elapsed_time = None
+        detailed_scores = None
+
+        p = generated['p']
+        offspring = generated['offspring']
+        code = generated['code']
+        prompt = generated['prompt']
+        full_res = generated['full_res']
+
+        try:
+
+            if possible_exception != "":
+                raise possible_exception
+
+            # Only passed if enabled, the other problems don't support it
+            eval_kwargs = {}
+            if self.early_abort:
+                eval_kwargs['worst_objective'] = self.get_worst_objective(pop)
+
+            cached = None
+            if self.fitness_cache is not None:
+                cached = self.fitness_cache.get(code)
+
             start_time = time.perf_counter_ns()  # Start timing
-            if self.n_p > 1:
+            if cached is not None:
+
+                print("[EOH_EC]: equivalent code in fitness cache, skip evaluation")
+                logging.info("[EOH_EC]: equivalent code in fitness cache, skip evaluation")
+                fitness, detailed_scores = cached
+                offspring['objective'] = float(np.round(fitness, 5))
+
+            elif self.eval_pool is not None:
+
+                fitness, detailed_scores = self.eval_pool.evaluate(code, **eval_kwargs)
+                offspring['objective'] = float(np.round(fitness, 5))
+
+            elif self.n_p > 1:
 
                 with concurrent.futures.ThreadPoolExecutor(max_workers=1) as executor:
-                    future = executor.submit(self.interface_eval.evaluate, code)
+                    future = executor.submit(self.interface_eval.evaluate, code, **eval_kwargs)
                     fitness, detailed_scores = future.result(timeout=self.timeout)
                     offspring['objective'] = float(np.round(fitness, 5))
                     future.cancel()
 
             else:
 
-                fitness, detailed_scores = self.interface_eval.evaluate(code)
+                fitness, detailed_scores = self.interface_eval.evaluate(code, **eval_kwargs)
                 offspring['objective'] = float(np.round(fitness, 5))
 
 
             end_time = time.perf_counter_ns()  # End timing
             elapsed_time = (end_time - start_time)  # Calculate elapsed time
 
+            if self.fitness_cache is not None and cached is None:
+                self.fitness_cache.put(code, fitness, detailed_scores)
+
             print(f"Thread Time: {elapsed_time}")
             logging.info(f"Thread Time: {elapsed_time}")
 
@@ -311,13 +410,16 @@ class InterfaceEC():
 
     
     def get_algorithm(self, pop, operator, pop_n="0"):
+        if self.pipeline:
+            return self.get_algorithm_pipelined(pop, operator, pop_n)
+
         results = []
 
         try:
             time_str = datetime.now().strftime("%y%m%d_%H%M%S")
             logging.info(f"Starting parallel execution for population {pop_n} with operator {operator} at {time_str}")
 
-            results = Parallel(n_jobs=self.n_p)(
+            results = Parallel(n_jobs=self.n_p, backend=self.parallel_backend)(
                 delayed(self.get_offspring)(pop, operator, f'pop_{pop_n}_op_{operator}_n{i}_{time_str}') for i in
                 range(self.pop_size)
             )
@@ -326,6 +428,9 @@ class InterfaceEC():
                 print('###################### Population Results####################')
                 print(results)
 
+            if self.eval_pool is not None:
+                logging.info(f"Evaluation pool: {self.eval_pool.get_stats()}")
+
         except multiprocessing.TimeoutError:
             logging.error("TIMEOUT ERROR IN PARALLEL: This should not be possible!.")
             print("TIMEOUT ERROR IN PARALLEL: This should not be possible!.")
@@ -349,4 +454,63 @@ class InterfaceEC():
 
         logging.info(f"Finished processing population {pop_n} with operator {operator}.")
         print(f"Finished processing population {pop_n} with operator {operator}.")
-        return out_p, out_off
\ No newline at end of file
+        return out_p, out_off
+
+    def get_algorithm_pipelined(self, pop, operator, pop_n="0"):
+        """
+        Same as get_algorithm, but the LLM requests are producers of a bounded
+        queue of generated offspring, which is consumed by one thread per
+        worker of the evaluation pool. A slow LLM response no longer blocks
+        the evaluations and the other way round.
+        """
+        time_str = datetime.now().strftime("%y%m%d_%H%M%S")
+        logging.info(f"Starting pipelined execution for population {pop_n} with operator {operator} at {time_str}")
+
+        candidates = queue.Queue(maxsize=self.pipeline_queue_size)
+        results = [None] * self.pop_size
+
+        def produce(i):
+            candidates.put((i, self.generate_offspring(pop, operator)))
+
+        def consume():
+            while True:
+                item = candidates.get()
+                if item is None:
+                    return
+                i, generated = item
+                try:
+                    results[i] = self.evaluate_offspring(pop, generated, f'pop_{pop_n}_op_{operator}_n{i}_{time_str}')
+                except Exception as e:
+                    # the consumer keeps draining the queue, otherwise the producers block on the full queue
+                    print(f"OFFSPRING CREATION FAILED: {e}")
+                    logging.error(f"OFFSPRING CREATION FAILED: {e}")
+                    results[i] = (None, {
+                        'algorithm': None,
+                        'code': None,
+                        'objective': None,
+                        'other_inf': None,
+                        'evaluation_time': None
+                    })
+
+        n_consumers = len(self.eval_pool.workers)
+        with concurrent.futures.ThreadPoolExecutor(max_workers=n_consumers) as consumers, \
+                concurrent.futures.ThreadPoolExecutor(max_workers=self.n_p) as producers:
+            consumer_futures = [consumers.submit(consume) for _ in range(n_consumers)]
+            producer_futures = [producers.submit(produce, i) for i in range(self.pop_size)]
+
+            concurrent.futures.wait(producer_futures)
+            for _ in range(n_consumers):
+                candidates.put(None)
+            for future in consumer_futures:
+                future.result()
+
+        out_p = [p for p, _ in results]
+        out_off = [off for _, off in results]
+
+        if self.debug:
+            for off in out_off:
+                print(f">>> check offsprings: \n {off}")
+
+        logging.info(f"Finished processing population {pop_n} with operator {operator}.")
+        print(f"Finished processing population {pop_n} with operator {operator}.")
+        return out_p, out_off
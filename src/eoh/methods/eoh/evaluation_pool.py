@@ -0,0 +1,200 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+import time
+import queue
+import signal
+import atexit
+import logging
+import warnings
+import threading
+import multiprocessing
+
+import numpy as np
+
+try:
+    import resource
+except ImportError:
+    # not available on windows, the memory limit is ignored there
+    resource = None
+
+
+def _set_memory_limit(memory_limit_mb):
+    if memory_limit_mb is None or resource is None:
+        return
+    limit = int(memory_limit_mb) * 1024 * 1024
+    resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+
+
+def _worker_loop(problem, connection, memory_limit_mb):
+    """
+    Evaluates code strings received over the connection until None is received.
+    The problem instance stays loaded between the tasks.
+    """
+    # own process group, a killed worker takes the process pools of the problem with it
+    if hasattr(os, "setsid"):
+        os.setsid()
+    warnings.filterwarnings("ignore")
+    _set_memory_limit(memory_limit_mb)
+
+    while True:
+        try:
+            task = connection.recv()
+        except EOFError:
+            break
+        if task is None:
+            break
+
+        code, kwargs = task
+        start_time = time.perf_counter()
+        try:
+            result = problem.evaluate(code, **kwargs)
+            message = ('ok', result)
+        except BaseException as e:
+            message = ('error', f"{type(e).__name__}: {e}")
+        connection.send(message + (time.perf_counter() - start_time,))
+
+
+class EvaluationWorker:
+    def __init__(self, context, problem, memory_limit_mb):
+        self.connection, child_connection = context.Pipe()
+        # not a daemon, the problem may start its own process pool
+        self.process = context.Process(target=_worker_loop,
+                                       args=(problem, child_connection, memory_limit_mb))
+        self.process.start()
+        child_connection.close()
+
+    def kill(self):
+        try:
+            # also before the join if the worker exited, its children may still run
+            os.killpg(self.process.pid, signal.SIGKILL)
+        except (AttributeError, ProcessLookupError, PermissionError):
+            # no process group yet or not supported
+            if self.process.is_alive():
+                self.process.kill()
+        self.process.join()
+        self.connection.close()
+
+    def stop(self):
+        try:
+            self.connection.send(None)
+        except (OSError, ValueError):
+            pass
+        self.process.join(timeout=5)
+        self.kill()
+
+
+class EvaluationPool:
+    def __init__(self, problem, n_workers, timeout, memory_limit_mb=None):
+        """
+        Long-lived worker processes which keep the problem instance loaded.
+
+        Every evaluation runs in an idle worker. A worker exceeding the
+        timeout (seconds) is killed and replaced by a new one, so runaway
+        heuristics do not block the evolution. memory_limit_mb limits the
+        address space of every worker.
+        """
+        self.problem = problem
+        self.timeout = timeout
+        self.memory_limit_mb = memory_limit_mb
+        # fork would copy locks held by the threads of the evolution, e.g. of stdout
+        start_methods = multiprocessing.get_all_start_methods()
+        self.context = multiprocessing.get_context("forkserver" if "forkserver" in start_methods else "spawn")
+
+        self.workers = [EvaluationWorker(self.context, problem, memory_limit_mb)
+                        for _ in range(max(1, n_workers))]
+        self.idle = queue.Queue()
+        for i in range(len(self.workers)):
+            self.idle.put(i)
+
+        self.lock = threading.Lock()
+        self.latencies = []
+        self.n_timeouts = 0
+        self.n_errors = 0
+        self.n_restarts = 0
+
+        atexit.register(self.shutdown)
+
+    def evaluate(self, code, **kwargs):
+        """
+        Evaluates the code in a worker and returns the result of problem.evaluate.
+        Raises TimeoutError if the worker was killed and RuntimeError if the evaluation failed.
+        """
+        i = self.idle.get()
+        worker = self.workers[i]
+        start_time = time.perf_counter()
+        try:
+            worker.connection.send((code, kwargs))
+            if not worker.connection.poll(self.timeout):
+                self.__restart(i, timeout=True)
+                raise TimeoutError(f"Evaluation exceeded {self.timeout} seconds, worker restarted")
+            try:
+                status, result, latency = worker.connection.recv()
+            except EOFError:
+                self.__restart(i)
+                raise RuntimeError(f"Evaluation worker died with exit code {worker.process.exitcode}")
+        finally:
+            self.idle.put(i)
+
+        self.__record(latency, error=status != 'ok')
+        logging.info(f"[EVAL_POOL]: worker {i} finished after {latency:.3f} s, "
+                     f"queue and transfer {time.perf_counter() - start_time - latency:.3f} s")
+        if status != 'ok':
+            raise RuntimeError(result)
+        return result
+
+    def __restart(self, i, timeout=False):
+        self.workers[i].kill()
+        self.workers[i] = EvaluationWorker(self.context, self.problem, self.memory_limit_mb)
+        with self.lock:
+            self.n_restarts += 1
+            self.n_timeouts += int(timeout)
+            self.n_errors += int(not timeout)
+
+    def __record(self, latency, error=False):
+        with self.lock:
+            self.latencies.append(latency)
+            self.n_errors += int(error)
+
+    def get_stats(self):
+        with self.lock:
+            latencies = np.array(self.latencies)
+            stats = {
+                'tasks': len(latencies),
+                'timeouts': self.n_timeouts,
+                'errors': self.n_errors,
+                'restarts': self.n_restarts,
+            }
+        if len(latencies) > 0:
+            stats.update({
+                'latency_mean': float(np.mean(latencies)),
+                'latency_p50': float(np.percentile(latencies, 50)),
+                'latency_p95': float(np.percentile(latencies, 95)),
+                'latency_max': float(np.max(latencies)),
+            })
+        return stats
+
+    def shutdown(self):
+        for worker in self.workers:
+            worker.stop()
+        self.workers = []
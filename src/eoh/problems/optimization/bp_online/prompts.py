@@ -23,7 +23,10 @@
 # SOFTWARE.
 
 class GetPrompts():
-    def __init__(self):
+    def __init__(self, batch=False):
+        """
+        With batch, 'item' is an array with the item size of every bin, see run.pack_items_batch.
+        """
         self.prompt_task = "I need help designing a novel score function that scoring a set of bins to assign an item. \
 In each step, the item will be assigned to the bin with the maximum score. If the rest capacity of a bin equals the maximum capacity, it will not be used. The final goal is to minimize the number of used bins."
         self.prompt_func_name = "score"
@@ -35,6 +38,17 @@ The output named 'scores' is the scores for the bins for assignment. "
 #Include the following imports at the beginning of the code: 'import numpy as np', and 'from numba import jit'. Place '@jit(nopython=True)' just above the 'priority' function definition."
         self.prompt_example = ""
 
+        if batch:
+            self.set_batch_prompts()
+
+    def set_batch_prompts(self):
+        self.prompt_inout_inf = "'item' and 'bins' are the sizes of the items and the rest capacities of feasible bins, which are larger than the item sizes. \
+The bins of several packing instances are scored at once, 'item' holds the size of the item to assign for every bin. \
+The output named 'scores' is the scores for the bins for assignment. "
+        self.prompt_other_inf = "Note that 'item', 'bins' and 'scores' are Numpy arrays of the same shape. Use element-wise Numpy operations on 'item' and 'bins', the score of a bin must only depend on its own item and rest capacity. \
+Do not aggregate over 'bins' (e.g. np.mean, np.max or sorting), such functions are rejected. \
+The novel function should be sufficiently complex in order to achieve better performance. It is important to ensure self-consistency."
+
     def get_task(self):
         return self.prompt_task
     
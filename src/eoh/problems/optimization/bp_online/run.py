@@ -25,15 +25,184 @@
 import numpy as np
 from .get_instance import GetData
 from .prompts import GetPrompts
+import json
+import time
 import types
+import hashlib
 import warnings
 import sys
 
+from joblib import Parallel, delayed
+
+
+def is_elementwise(score, capacity, batch=False, n_bins=8) -> bool:
+    """
+    True if the heuristic scores every bin on its own, i.e. the score of a bin
+    does not change when it is scored alone. Heuristics using aggregates over
+    the bins (np.mean(bins), sorting, ...) are not element-wise.
+
+    Probed with random bins of the capacity, with batch 'item' is an array.
+    """
+    rng = np.random.default_rng(0)
+    capacity = max(int(capacity), 2)
+    items = rng.integers(1, capacity // 2 + 1, size=n_bins)
+    bins = rng.integers(capacity // 2, capacity + 1, size=n_bins)
+
+    try:
+        with warnings.catch_warnings():
+            warnings.simplefilter("ignore")
+            if batch:
+                scores = np.asarray(score(items, bins), dtype=float)
+                single_scores = [np.asarray(score(items[i:i + 1], bins[i:i + 1]), dtype=float) for i in range(n_bins)]
+            else:
+                scores = np.asarray(score(items[0], bins), dtype=float)
+                single_scores = [np.asarray(score(items[0], bins[i:i + 1]), dtype=float) for i in range(n_bins)]
+        single_scores = np.concatenate([single.reshape(-1) for single in single_scores])
+    except Exception:
+        return False
+
+    return scores.shape == (n_bins,) and single_scores.shape == (n_bins,) and \
+        np.allclose(scores, single_scores, equal_nan=True)
+
+
+def pack_items(items, capacity, score) -> int:
+    """
+    Online binpacking of `items` into bins of the capacity, returns the number of used bins.
+
+    Only the open bins and one fresh bin are scored. The fresh bin stands
+    for the unused bins of BPONLINE.online_binpack, which are all equal, so
+    a heuristic scoring every bin on its own selects the same bin. A bin is
+    closed when the smallest item does not fit anymore.
+
+    The result only equals online_binpack for element-wise heuristics, see is_elementwise.
+    """
+    items = np.asarray(items)
+    min_item = items.min(initial=capacity)
+
+    # remaining capacity of the open bins in the order they were opened, then the fresh bin
+    bins = np.empty(len(items) + 1, dtype=np.result_type(items, np.asarray(capacity)))
+    bins[0] = capacity
+    n_open = 0
+    n_used = 0
+
+    for item in items:
+        valid_bin_indices = np.flatnonzero(bins[:n_open + 1] >= item)
+        priorities = score(item, bins[valid_bin_indices])
+        best_bin = valid_bin_indices[np.argmax(priorities)]
+
+        if best_bin == n_open:
+            n_used += 1
+            n_open += 1
+            bins[n_open] = capacity
+        bins[best_bin] -= item
+
+        if bins[best_bin] < min_item:
+            bins[best_bin:n_open] = bins[best_bin + 1:n_open + 1]
+            n_open -= 1
+
+    return n_used
+
+
+def pack_items_batch(instances, score) -> list:
+    """
+    pack_items for several instances at once, the heuristic scores the
+    candidate bins of all instances in one call. 'item' is then an array
+    with the item size of every candidate bin.
+
+    Only valid for element-wise heuristics (see is_elementwise), an aggregate
+    over 'bins' would mix the bins of different instances.
+
+    instances is a list of (items, capacity), returns the number of used bins per instance.
+    """
+    items = [np.asarray(instance_items) for instance_items, _ in instances]
+    capacities = [capacity for _, capacity in instances]
+    min_items = [instance_items.min(initial=capacity) for instance_items, capacity in zip(items, capacities)]
+
+    bins = [np.empty(len(instance_items) + 1, dtype=np.result_type(instance_items, np.asarray(capacity)))
+            for instance_items, capacity in zip(items, capacities)]
+    for i, capacity in enumerate(capacities):
+        bins[i][0] = capacity
+    n_open = [0] * len(instances)
+    n_used = [0] * len(instances)
+
+    for step in range(max([len(instance_items) for instance_items in items], default=0)):
+        active = [i for i in range(len(instances)) if step < len(items[i])]
+
+        valid_bin_indices = [np.flatnonzero(bins[i][:n_open[i] + 1] >= items[i][step]) for i in active]
+        counts = [len(valid) for valid in valid_bin_indices]
+        candidate_items = np.repeat([items[i][step] for i in active], counts)
+        candidate_bins = np.concatenate([bins[i][valid] for i, valid in zip(active, valid_bin_indices)])
+
+        priorities = np.asarray(score(candidate_items, candidate_bins))
+        offsets = np.cumsum([0] + counts)
+
+        for k, i in enumerate(active):
+            best_bin = valid_bin_indices[k][np.argmax(priorities[offsets[k]:offsets[k + 1]])]
+
+            if best_bin == n_open[i]:
+                n_used[i] += 1
+                n_open[i] += 1
+                bins[i][n_open[i]] = capacities[i]
+            bins[i][best_bin] -= items[i][step]
+
+            if bins[i][best_bin] < min_items[i]:
+                bins[i][best_bin:n_open[i]] = bins[i][best_bin + 1:n_open[i] + 1]
+                n_open[i] -= 1
+
+    return n_used
+
+
+def as_items(items) -> np.ndarray:
+    """
+    Items as int64 array like the item lists of the instances, stored datasets use smaller types.
+    """
+    items = np.asarray(items)
+    return items.astype(np.promote_types(items.dtype, np.int64), copy=False)
+
+
+def timed_pack_items(items, capacity, score):
+    """
+    Returns the number of used bins and the seconds of pack_items.
+    """
+    start_time = time.perf_counter()
+    num_bins = pack_items(as_items(items), capacity, score)
+    return num_bins, time.perf_counter() - start_time
+
+
+def load_heuristic(code_string):
+    heuristic_module = types.ModuleType("heuristic_module")
+    exec(code_string, heuristic_module.__dict__)
+    sys.modules[heuristic_module.__name__] = heuristic_module
+    return heuristic_module
+
+
+def pack_items_from_source(code_string, items, capacity):
+    """
+    Process pool entry point, the heuristic is shipped as source code.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return timed_pack_items(items, capacity, load_heuristic(code_string).score)
+
+
 class BPONLINE():
-    def __init__(self):
-        getdate = GetData()
+    def __init__(self, n_jobs=1, compact_bins=False, batch=False, dataset_path=None, datasets=None):
+        """
+        Parameters:
+        - n_jobs (int): Number of processes to evaluate the instances of one heuristic.
+        - compact_bins (bool): Score only the open bins and one fresh bin, see pack_items.
+          Heuristics which are not element-wise are still scored on all bins.
+        - batch (bool): Score the bins of all instances of a dataset in one call, see pack_items_batch.
+          Heuristics which are not element-wise are rejected.
+        - dataset_path (str): Directory with converted datasets, see get_instance.convert_dataset_file.
+        - datasets (list): Names of the evaluated datasets, None for all.
+        """
+        getdate = GetData(dataset_path, datasets)
         self.instances, self.lb = getdate.get_instances()
-        self.prompts = GetPrompts()
+        self.prompts = GetPrompts(batch=batch)
+        self.n_jobs = n_jobs
+        self.compact_bins = compact_bins
+        self.batch = batch
 
     def get_valid_bin_indices(self,item: float, bins: np.ndarray) -> np.ndarray:
         """Returns indices of bins in which item can fit."""
@@ -62,50 +231,97 @@ class BPONLINE():
         return packing, bins
 
 
-    # @funsearch.run
-    def evaluateGreedy(self,alg) -> float:
-        # algorithm_module = importlib.import_module("ael_alg")
-        # alg = importlib.reload(algorithm_module)  
-        """Evaluate heuristic function on a set of online binpacking instances."""
-        # List storing number of bins used for each instance.
-        #num_bins = []
-        # Perform online binpacking for each instance.
-        # for name in instances:
-        #     #print(name)
-
-        for name, dataset in self.instances.items():
-            num_bins_list = []
-            for _, instance in dataset.items():
-
-                capacity = instance['capacity']
-                items = np.array(instance['items'])
-
-                # items = items/capacity
-                # capacity = 1.0
+    def pack_instances(self, instances, alg, code_string=None) -> list:
+        """
+        Packs the (items, capacity) instances, returns the number of used bins and the seconds per instance.
+        """
+        elementwise = (self.batch or self.compact_bins) and len(instances) > 0 and \
+            is_elementwise(alg.score, instances[0][1], self.batch)
+
+        if self.batch:
+            if not elementwise:
+                raise ValueError("batch evaluation needs a heuristic which scores every bin on its own")
+            start_time = time.perf_counter()
+            num_bins = pack_items_batch([(as_items(items), capacity) for items, capacity in instances], alg.score)
+            eval_time = (time.perf_counter() - start_time) / max(len(instances), 1)
+            return [(n, eval_time) for n in num_bins]
 
+        if not elementwise:
+            results = []
+            for items, capacity in instances:
+                start_time = time.perf_counter()
                 # Create num_items bins so there will always be space for all items,
                 # regardless of packing order. Array has shape (num_items,).
-                bins = np.array([capacity for _ in range(instance['num_items'])])
-                # Pack items into bins and return remaining capacity in bins_packed, which
-                # has shape (num_items,).
-                _, bins_packed = self.online_binpack(items, bins, alg)
+                bins = np.array([capacity for _ in range(len(items))])
+                _, bins_packed = self.online_binpack(as_items(items), bins, alg)
                 # If remaining capacity in a bin is equal to initial capacity, then it is
                 # unused. Count number of used bins.
-                num_bins = (bins_packed != capacity).sum()
+                results.append(((bins_packed != capacity).sum(), time.perf_counter() - start_time))
+            return results
+
+        if self.n_jobs > 1 and code_string is not None:
+            # memory-mapped items are sent to the workers as file references
+            return Parallel(n_jobs=self.n_jobs)(
+                delayed(pack_items_from_source)(code_string, items, capacity) for items, capacity in instances)
 
-                num_bins_list.append(-num_bins)
+        return [timed_pack_items(items, capacity, alg.score) for items, capacity in instances]
+
+    # @funsearch.run
+    def evaluateGreedy(self, alg, code_string=None):
+        """
+        Evaluate heuristic function on all datasets of online binpacking instances.
 
-            # avg_num_bins = -self.evaluateGreedy(dataset, algorithm)
-            avg_num_bins = -np.mean(np.array(num_bins_list))
-            fitness = (avg_num_bins - self.lb[name]) / self.lb[name]
+        The fitness of a dataset is the excess of the average number of bins
+        over the L1 lower bound, the returned fitness is the mean over the
+        datasets. details holds the results per dataset.
+        """
+        names = list(self.instances.keys())
+        instances = [[(instance['items'], instance['capacity']) for instance in self.instances[name].values()]
+                     for name in names]
 
+        if self.batch:
+            results = [self.pack_instances(dataset, alg, code_string) for dataset in instances]
+        else:
+            # the instances of all datasets are evaluated together, so all processes are used
+            flat_results = self.pack_instances([instance for dataset in instances for instance in dataset],
+                                               alg, code_string)
+            offsets = np.cumsum([0] + [len(dataset) for dataset in instances])
+            results = [flat_results[offsets[i]:offsets[i + 1]] for i in range(len(names))]
 
-        # Score of heuristic function is negative of average number of bins used
-        # across instances (as we want to minimize number of bins).
+        detailed_fitness = []
+        num_bins_list = []
+        eval_times = []
+        for name, dataset_results in zip(names, results):
+            num_bins = [int(n) for n, _ in dataset_results]
+            avg_num_bins = np.mean(np.array(num_bins))
+            detailed_fitness.append(float((avg_num_bins - self.lb[name]) / self.lb[name]))
+            num_bins_list.append(num_bins)
+            eval_times.append([eval_time for _, eval_time in dataset_results])
 
-        return fitness
+        details = {
+            'datasets': names,
+            'detailed_fitness': detailed_fitness,
+            'num_bins': num_bins_list,
+            'lower_bound': [float(self.lb[name]) for name in names],
+            'eval_time': eval_times,
+        }
 
+        # Score of heuristic function is the mean excess of the number of bins used
+        # over the datasets (as we want to minimize number of bins).
+        return float(np.mean(detailed_fitness)), details
 
+    def get_fingerprint(self):
+        """
+        Hash of the datasets and evaluation settings, used by the fitness cache.
+        """
+        settings = {
+            'datasets': {name: [len(dataset), float(self.lb[name])] + [int(instance['num_items'])
+                                                                      for instance in dataset.values()]
+                         for name, dataset in self.instances.items()},
+            'compact_bins': self.compact_bins,
+            'batch': self.batch,
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
 
     # def evaluate(self):
     #     try:
@@ -140,9 +356,9 @@ class BPONLINE():
                 # Add the module to sys.modules so it can be imported
                 sys.modules[heuristic_module.__name__] = heuristic_module
 
-                fitness = self.evaluateGreedy(heuristic_module)
+                fitness, details = self.evaluateGreedy(heuristic_module, code_string)
 
-                return fitness
+                return fitness, details
         except Exception as e:
             #print("Error:", str(e))
             return None
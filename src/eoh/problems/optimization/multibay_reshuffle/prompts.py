@@ -22,7 +22,11 @@
 
 
 class GetPrompts():
-    def __init__(self):
+    def __init__(self, batch=False):
+        """
+        With batch, the heuristic gets all warehouse states as one numpy array
+        and the moves, so it can be written with vectorised numpy operations.
+        """
         self.prompt_task = ("Act as a professional in algorithm designer. "
                             "Design a heuristic for a warehouse optimization problem to minimize the number of reshuffling moves needed to reach a blockage-free state. "
                             "If a unit load of a lower priority class hinders access to a unit load of a higher priority class it is deemed blocking. "
@@ -86,6 +90,57 @@ class GetPrompts():
                                "[-3, -1, -4] "
                                )
 
+        if batch:
+            self.set_batch_prompts()
+
+    def set_batch_prompts(self):
+        self.prompt_func_inputs = ["warehouse_states", "moves"]
+        self.prompt_inout_inf = ("'warehouse_states' contains all potential warehouse states after all potential reshuffling moves. "
+                                 "'moves' contains the reshuffling move that leads to each warehouse state. "
+                                 "The output named 'scores' is the scores for the warehouse states. ")
+        self.prompt_other_inf = ("Note that 'warehouse_states' is a numpy array of integers with the shape (states, lanes, slots). "
+                                 "'moves' is a numpy array of integers with the shape (states, 3). "
+                                 "'scores' must be a numpy array of integers or floats with the shape (states,). "
+                                 "Use vectorised numpy operations over all states instead of Python loops. "
+                                 "Avoid utilizing the random component, and it is crucial to maintain self-consistency. "
+                                 "Do not give additional explanations. "
+                                 "Don't create additional methods and please avoid nesting methods. "
+                                 )
+        self.prompt_example = ("warehouse_states[s] is a warehouse state, warehouse_states[s, l] is a lane of unit loads. "
+                               "The first slot index (index 0) is the outermost slot in the lane. "
+                               "The highest slot index is the innermost slot in the lane. "
+                               "Lanes are accessed from the first index to the highest index. "
+                               "Each integer represents a unit load and its priority class. "
+                               "Unit load of the same priority class are equal. "
+                               "A 1 represents the highest priority class. "
+                               "A 5 represents the lowest priority class. "
+                               "A 0 represents an empty slot. "
+                               "Lanes can have a different number of slots. "
+                               "A -1 marks a slot that does not exist, all -1s are at the end of a shorter lane. "
+                               "Each lane must have all 0s (empty slots) grouped at the start or have no 0s at all. "
+                               "\n "
+                               "Examples for blocking unit loads: "
+                               "In the lane [0, 4, 1] the 4 blocks access to 1. "
+                               "In the lane [0, 5, 1, 5, 2] the two 5's block access to the 2 and 1. "
+                               "In the lane [0, 4, 3, -1] the 4 blocks access to the 3. "
+                               "\n "
+                               "Each row of 'moves' is [from_lane, to_lane, priority]: "
+                               "the unit load with the priority class was moved from the lane with index from_lane "
+                               "to the lane with index to_lane of the warehouse state. "
+                               "\n "
+                               "Example for 'warehouse_states': "
+                               "np.array(["
+                               "[[0, 2, 3, -1], [0, 0, 5, 1], [5, 1, 1, -1]], "
+                               "[[0, 2, 3, -1], [1, 5, 5, 1], [0, 0, 1, -1]], "
+                               "[[0, 0, 3, -1], [2, 5, 5, 1], [0, 1, 1, -1]],"
+                               "]) "
+                               "Example for 'moves': "
+                               "np.array([[1, 2, 5], [2, 1, 1], [0, 1, 2]]) "
+                               "\n "
+                               "Example for 'scores': "
+                               "np.array([0, 1, 3]) "
+                               )
+
     def get_task(self):
         return self.prompt_task
     
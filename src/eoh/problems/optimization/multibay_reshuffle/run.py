@@ -23,25 +23,27 @@
 
 import os
 import sys
+import json
+import atexit
 import time
+import hashlib
 import types
-import datetime
 import warnings
 import numpy as np
+import multiprocessing
 
 from .prompts import GetPrompts
 
 from src.util.eoh_util import (
     load_experiments,
     get_access_directions,
-    create_virtual_lane)
+    get_instance_lanes,
+    get_instance_json)
 
 from src.bay.warehouse import Warehouse
+from src.bay.warehouse_cache import get_warehouse
 
-from src.util.eoh_util import (
-    get_virtual_lane_score,
-    convert_vl_to_list,
-    create_lanes)
+from src.util.successor_util import generate_successors
 
 from dotenv import load_dotenv
 
@@ -49,96 +51,376 @@ from dotenv import load_dotenv
 load_dotenv()
 
 
+# Defaults of eva_max_moves and eva_instance_timeout
 MAX_NUMBER_OF_MOVES = 100
 TIMEOUT_SECONDS = 60
+
+# Handling of moves back to an already visited state, see eva_cycle_policy
+CYCLE_POLICY_OFF = "off"
+CYCLE_POLICY_MASK = "mask"
+CYCLE_POLICY_ABORT = "abort"
+
 USE_REFERENCE_SOLUTION = True
 
+# Heuristic modules compiled in this process, see load_heuristic
+_HEURISTIC_MODULES = {}
+
+# Process pool for the instances and its (n_jobs, layouts), kept between evaluations, see get_instance_pool
+_INSTANCE_POOL = None
+_INSTANCE_POOL_KEY = None
+
+
+def mutlibay_reshuffeling(priority, wh: Warehouse, batch=False,
+                          max_moves=MAX_NUMBER_OF_MOVES, time_limit=TIMEOUT_SECONDS,
+                          cycle_policy=CYCLE_POLICY_OFF):
+    """
+    Applies the move with the highest score until all lanes are sorted.
 
-def mutlibay_reshuffeling(priority, wh: Warehouse):
+    With batch, the heuristic gets all successors as one numpy array and the
+    moves, see GetPrompts. Otherwise as three levels nested lists.
 
-    start = datetime.datetime.now()
+    The cycle policy handles a selected move back to a visited state: "mask"
+    takes the best move to a new state instead (if there is one), "abort"
+    stops like a timeout.
+
+    Returns the number of moves, if the time limit (seconds) was exceeded
+    and the number of selected moves back to a visited state.
+    A timeout is penalised with max_moves, so slow heuristics are scored
+    independently of how far they got.
+    """
+
+    end_time = time.perf_counter() + time_limit
     current_move_number = 0
+    timed_out = False
+    cycles = 0
+
+    # the unsorted lanes are tracked incrementally while applying the moves
+    lanes = wh.get_lane_matrix()
 
-    while (get_virtual_lane_score(convert_vl_to_list(wh.virtual_lanes)) > 0
-           and start.second + TIMEOUT_SECONDS > datetime.datetime.now().second
-           and current_move_number < MAX_NUMBER_OF_MOVES):
+    if cycle_policy != CYCLE_POLICY_OFF:
+        visited = {lanes.get_hash()}
 
-        possible_lanes, _ = create_lanes(wh)
+    while lanes.get_unsorted_count() > 0 and current_move_number < max_moves:
 
-        virtual_lane_as_list = [convert_vl_to_list(inst) for inst in possible_lanes]
+        if time.perf_counter() > end_time:
+            timed_out = True
+            break
 
-        fs_prio = priority.select_next_move(virtual_lane_as_list)
+        possible_lanes = generate_successors(lanes)
+
+        if batch:
+            warehouse_states, moves = possible_lanes.as_tensor()
+            fs_prio = priority.select_next_move(warehouse_states, moves)
+        else:
+            virtual_lane_as_list = possible_lanes.as_lists()
+            fs_prio = priority.select_next_move(virtual_lane_as_list)
 
         selection_index = np.argmax(fs_prio)
 
-        wh.virtual_lanes = possible_lanes[selection_index]
+        if cycle_policy != CYCLE_POLICY_OFF:
+            from_lanes, to_lanes, priorities = np.array(possible_lanes.deltas).reshape(-1, 3).T
+            hashes = lanes.get_successor_hashes(from_lanes, to_lanes, priorities)
+
+            if int(hashes[selection_index]) in visited:
+                cycles += 1
+                if cycle_policy == CYCLE_POLICY_ABORT:
+                    timed_out = True
+                    break
+
+                new_states = np.array([int(h) not in visited for h in hashes])
+                if np.any(new_states):
+                    scores = np.asarray(fs_prio, dtype=float).copy()
+                    scores[~new_states] = -np.inf
+                    selection_index = np.argmax(scores)
+
+        from_lane, to_lane, _ = possible_lanes.deltas[selection_index]
+        lanes.apply_move(from_lane, to_lane)
+
+        if cycle_policy != CYCLE_POLICY_OFF:
+            visited.add(lanes.get_hash())
 
         current_move_number += 1
 
-    return current_move_number
+    wh.set_lane_matrix(lanes)
+
+    # an aborted cycle is penalised like a timeout
+    if timed_out:
+        current_move_number = max_moves
+
+    return current_move_number, timed_out, cycles
+
+def load_heuristic(code_string):
+    """
+    Executes the heuristic code in a new module. The last module is kept,
+    so workers compile the code only once for all instances of an offspring.
+    """
+    heuristic_module = _HEURISTIC_MODULES.get(code_string)
+    if heuristic_module is None:
+        heuristic_module = types.ModuleType("heuristic_module")
+        exec(code_string, heuristic_module.__dict__)
+        _HEURISTIC_MODULES.clear()
+        _HEURISTIC_MODULES[code_string] = heuristic_module
+    return heuristic_module
+
+
+def get_instance_score(moves, ref_score):
+    if USE_REFERENCE_SOLUTION:
+        # Don't divide zero
+        if moves == 0:
+            # if ref_score is also zero, then overall score is 0 and nothing added.
+            # Otherwise, the solution is wrong and 1 is added.
+            if ref_score != 0:
+                return 1
+            return 0
+        return (moves - ref_score) / ref_score
+    return moves
+
+
+def get_move_lower_bound(config):
+    """
+    Every unsorted lane needs at least one move, a move sorts at most the
+    lane it removes the load from. Adding a load never sorts a lane.
+    """
+    return get_instance_lanes(config).get_virtual_lane_score()
+
+
+def get_min_instance_score(config=None, ref_score=None, max_moves=MAX_NUMBER_OF_MOVES):
+    """
+    Lowest score a single instance can contribute, used to bound the final score.
+    Without the instance, the bound of moves >= 0 is used. A run stops after
+    max_moves moves, so the bound never exceeds max_moves.
+    """
+    if config is None or (USE_REFERENCE_SOLUTION and ref_score == 0):
+        # With the reference solution, the score is (moves - ref) / ref with moves >= 0
+        if USE_REFERENCE_SOLUTION:
+            return -1.0
+        return 0.0
+    # the score increases with the number of moves
+    return get_instance_score(min(get_move_lower_bound(config), max_moves), ref_score)
+
+
+def evaluate_instance(next_move, config, ref_score, batch=False,
+                      max_moves=MAX_NUMBER_OF_MOVES, time_limit=TIMEOUT_SECONDS, deadline=None,
+                      cycle_policy=CYCLE_POLICY_OFF):
+    """
+    Runs the reshuffling for one instance.
+
+    The time limit in seconds is shortened to the deadline of the offspring,
+    a time.time() timestamp, because it is shared by the worker processes.
+
+    Returns the number of moves, the instance score, the evaluation time,
+    if it timed out and the number of moves back to a visited state.
+    """
+    if deadline is not None:
+        time_limit = min(time_limit, deadline - time.time())
 
-def eval_multibay_reshuffle(next_move, instance_configs, ref_scores):
     path = os.path.join(os.getenv('BASE_PATH'), 'warehouse_layouts')
-    
+
+    access_directions = get_access_directions(config)
+    wh = get_warehouse(os.path.join(path, config['layout_file']), access_directions)
+    wh.set_lane_matrix(get_instance_lanes(config))
+
+    eval_start_time = time.perf_counter()
+    moves, timed_out, cycles = mutlibay_reshuffeling(next_move, wh, batch, max_moves, time_limit, cycle_policy)
+    current_score = get_instance_score(moves, ref_score)
+
+    return moves, current_score, time.perf_counter() - eval_start_time, timed_out, cycles
+
+
+def evaluate_instance_from_source(code_string, config, ref_score, batch=False, **limits):
+    """
+    Process pool entry point, the heuristic is shipped as source code.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        return evaluate_instance(load_heuristic(code_string), config, ref_score, batch, **limits)
+
+
+def get_layouts(instance_configs) -> list:
+    """
+    Distinct (layout file, access directions) of the instances.
+    """
+    path = os.path.join(os.getenv('BASE_PATH'), 'warehouse_layouts')
+    layouts = []
+    for config in instance_configs:
+        layout = (os.path.join(path, config['layout_file']), get_access_directions(config))
+        if layout not in layouts:
+            layouts.append(layout)
+    return layouts
+
+
+def warm_warehouse_cache(layouts):
+    """
+    Pool initializer, parses the layouts once per worker instead of once per evaluation.
+    """
+    for filename, access_directions in layouts:
+        try:
+            get_warehouse(filename, access_directions)
+        except Exception as e:
+            print(f"[WARNING]: warehouse layout {filename} could not be loaded! {e!r}")
+
+
+def get_instance_pool(n_jobs, instance_configs):
+    """
+    Process pool for the instances, kept between the evaluations of this
+    process so the warehouse cache of the workers stays warm.
+    """
+    global _INSTANCE_POOL, _INSTANCE_POOL_KEY
+
+    layouts = get_layouts(instance_configs)
+    key = (n_jobs, repr(layouts))
+    if _INSTANCE_POOL is not None and _INSTANCE_POOL_KEY != key:
+        close_instance_pool()
+
+    if _INSTANCE_POOL is None:
+        _INSTANCE_POOL = multiprocessing.Pool(processes=n_jobs, initializer=warm_warehouse_cache,
+                                              initargs=(layouts,))
+        _INSTANCE_POOL_KEY = key
+    return _INSTANCE_POOL
+
+
+def close_instance_pool():
+    """
+    Stops the instance pool and the instances still running in it.
+    """
+    global _INSTANCE_POOL, _INSTANCE_POOL_KEY
+
+    if _INSTANCE_POOL is not None:
+        _INSTANCE_POOL.terminate()
+        _INSTANCE_POOL.join()
+    _INSTANCE_POOL = None
+    _INSTANCE_POOL_KEY = None
+
+
+atexit.register(close_instance_pool)
+
+
+def eval_multibay_reshuffle(next_move, instance_configs, ref_scores,
+                            n_jobs=1, code_string=None, worst_objective=None, batch=False,
+                            min_scores=None, max_moves=MAX_NUMBER_OF_MOVES,
+                            instance_timeout=TIMEOUT_SECONDS, offspring_timeout=None,
+                            cycle_policy=CYCLE_POLICY_OFF):
+    """
+    Evaluates the heuristic on all instances.
+
+    With n_jobs > 1 and the heuristic code_string, the instances are evaluated
+    in a process pool, which is kept for the next evaluation (see
+    get_instance_pool) unless instances are still running. If worst_objective is set, the instances are raced in
+    their fixed order: the evaluation stops as soon as the final score is
+    guaranteed to be worse, the returned score is then the lower bound and
+    details['aborted'] is True. The bound uses min_scores, the lowest score
+    of each instance (see get_min_instance_score).
+
+    Every instance stops after instance_timeout seconds, all instances
+    together after offspring_timeout seconds. Timed out instances count
+    max_moves moves and are marked in details['timeouts'].
+
+    details['cycles'] counts the selected moves back to a visited state per
+    instance, the cycle_policy decides how they are handled (see
+    mutlibay_reshuffeling). Instances aborted on a cycle are also in
+    details['timeouts'].
+    With batch, the heuristic follows the batch contract of GetPrompts.
+    """
     number_of_exp = len(instance_configs)
 
     detailed_fitness =  []
     h_initials =  []
     algo_moves =  []
     eval_times = []
+    timeouts = []
+    cycles = []
 
-    overall_score = 0
-
-    for i, config in enumerate(instance_configs):
-
-        access_directions = get_access_directions(config)
-        wh = Warehouse(os.path.join(path, config['layout_file']), access_directions)
-        wh.virtual_lanes = create_virtual_lane(config)
+    limits = {'max_moves': max_moves, 'time_limit': instance_timeout, 'deadline': None,
+              'cycle_policy': cycle_policy}
+    if offspring_timeout is not None:
+        limits['deadline'] = time.time() + offspring_timeout
 
-        eval_start_time = time.perf_counter()
-        current_score = 0
-        if USE_REFERENCE_SOLUTION:
-            score = mutlibay_reshuffeling(next_move, wh)
-
-            # Don't divide zero
-            if score == 0:
-                # if ref_score is also zero, then overall score is 0 and nothing added.
-                # Otherwise, the solution is wrong and 1 is added.
-                if ref_scores[i] != 0:
-                    current_score = 1
+    overall_score = 0
+    aborted = False
+
+    if worst_objective is not None and min_scores is None:
+        min_scores = [get_min_instance_score(config, ref_scores[i], max_moves) for i, config in enumerate(instance_configs)]
+    # lowest total score of the instances after i
+    remaining_min_scores = np.zeros(number_of_exp)
+    if min_scores is not None:
+        remaining_min_scores[:-1] = np.cumsum(np.array(min_scores[::-1], dtype=float))[::-1][1:]
+
+    pool = None
+    completed = False
+    if n_jobs > 1 and code_string is not None:
+        pool = get_instance_pool(n_jobs, instance_configs)
+        results = [pool.apply_async(evaluate_instance_from_source, (code_string, config, ref_scores[i], batch), limits)
+                   for i, config in enumerate(instance_configs)]
+
+    try:
+        for i, config in enumerate(instance_configs):
+
+            if pool is not None:
+                moves, current_score, eval_time, timed_out, n_cycles = results[i].get()
             else:
-                current_score = (score - ref_scores[i]) / ref_scores[i]
-
-        else:
-            current_score = mutlibay_reshuffeling(next_move, wh)
-
-        algo_moves.append(score)
-        h_initials.append(ref_scores[i])
-        detailed_fitness.append(current_score)
-        eval_times.append(time.perf_counter() - eval_start_time)
-        overall_score += current_score
+                moves, current_score, eval_time, timed_out, n_cycles = evaluate_instance(next_move, config,
+                                                                                         ref_scores[i],
+                                                                                         batch, **limits)
+
+            algo_moves.append(moves)
+            h_initials.append(ref_scores[i])
+            detailed_fitness.append(current_score)
+            eval_times.append(eval_time)
+            timeouts.append(timed_out)
+            cycles.append(n_cycles)
+            overall_score += current_score
+
+            remaining = number_of_exp - (i + 1)
+            lower_bound = (overall_score + remaining_min_scores[i]) / number_of_exp
+            if worst_objective is not None and remaining > 0 and lower_bound > worst_objective:
+                aborted = True
+                overall_score = lower_bound * number_of_exp
+                break
+        completed = not aborted
+    finally:
+        if pool is not None and not completed:
+            # the evaluation was aborted or failed, stop the running instances
+            close_instance_pool()
 
     details = {
         'detailed_fitness': detailed_fitness,
         'moves': algo_moves,
         'reference': h_initials,
-        "eval_time": eval_times
+        "eval_time": eval_times,
+        'timeouts': timeouts,
+        'cycles': cycles,
+        'aborted': aborted
     }
 
     return (overall_score / number_of_exp), details
 
 
 class MULTIBAY_RESHUFFLECONST:
-    def __init__(self, eoh_experiment_file, code_string = None):
+    def __init__(self, eoh_experiment_file, code_string = None, n_jobs = 1, batch = False,
+                 max_moves = MAX_NUMBER_OF_MOVES, instance_timeout = TIMEOUT_SECONDS, offspring_timeout = None,
+                 cycle_policy = CYCLE_POLICY_OFF):
         """
         Initializes the reshuffle evaluation with a heuristic code string and instance count.
 
         Parameters:
         - code_string (str): Heuristic function as a string.
+        - n_jobs (int): Number of processes to evaluate the instances of one heuristic.
+        - batch (bool): Heuristics score all warehouse states as one numpy array.
+        - max_moves (int): Moves per instance, also the penalty of a timeout.
+        - instance_timeout (float): Seconds per instance.
+        - offspring_timeout (float): Seconds for all instances, None for no limit.
+        - cycle_policy (str): "off", "mask" or "abort" moves back to a visited state.
         """
-        self.prompts = GetPrompts()
+        self.prompts = GetPrompts(batch=batch)
+        self.n_jobs = n_jobs
+        self.batch = batch
+        self.max_moves = max_moves
+        self.instance_timeout = instance_timeout
+        self.offspring_timeout = offspring_timeout
+        self.cycle_policy = cycle_policy
 
         self.instance_configs, self.ref_scores = load_experiments(eoh_experiment_file)
+        self.min_scores = None
 
         if len(self.instance_configs) == 0:
             print("XXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXXX")
@@ -150,7 +432,32 @@ class MULTIBAY_RESHUFFLECONST:
         if code_string != None:
             self.fitness = self.evaluate(code_string)
 
-    def evaluate(self, code_string):
+    def get_min_scores(self, worst_objective):
+        """
+        Lowest score of every instance, only needed to abort evaluations.
+        """
+        if worst_objective is not None and self.min_scores is None:
+            self.min_scores = [get_min_instance_score(config, self.ref_scores[i], self.max_moves)
+                               for i, config in enumerate(self.instance_configs)]
+        return self.min_scores
+
+    def get_fingerprint(self):
+        """
+        Hash of the instances and evaluation settings, used by the fitness cache.
+        """
+        settings = {
+            'instances': [get_instance_json(config) for config in self.instance_configs],
+            'reference': self.ref_scores,
+            'use_reference': USE_REFERENCE_SOLUTION,
+            'max_moves': self.max_moves,
+            'instance_timeout': self.instance_timeout,
+            'offspring_timeout': self.offspring_timeout,
+            'batch': self.batch,
+            'cycle_policy': self.cycle_policy,
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+    def evaluate(self, code_string, worst_objective = None):
         try:
             # Suppress warnings
             with warnings.catch_warnings():
@@ -166,7 +473,15 @@ class MULTIBAY_RESHUFFLECONST:
 
                 try:
                     # Now you can use the module as you would any other
-                    fitness, details = eval_multibay_reshuffle(heuristic_module, self.instance_configs, self.ref_scores)
+                    fitness, details = eval_multibay_reshuffle(heuristic_module, self.instance_configs, self.ref_scores,
+                                                               n_jobs=self.n_jobs, code_string=code_string,
+                                                               worst_objective=worst_objective,
+                                                               batch=self.batch,
+                                                               min_scores=self.get_min_scores(worst_objective),
+                                                               max_moves=self.max_moves,
+                                                               instance_timeout=self.instance_timeout,
+                                                               offspring_timeout=self.offspring_timeout,
+                                                               cycle_policy=self.cycle_policy)
                 except Exception as e:
                     print(f"Error in Evaluation: {e}")
 
@@ -24,116 +24,199 @@
 
 import numpy as np
 import sys
+import json
+import time
 import types
+import hashlib
 import warnings
+from joblib import Parallel, delayed
 from .prompts import GetPrompts
 from .get_instance import GetData
 
-class TSPCONST():
-    def __init__(self) -> None:
-        # ABS_PATH = os.path.dirname(os.path.abspath(__file__))
-        # sys.path.append(ABS_PATH)  # This is for finding all the modules
-        # Construct the absolute path to the pickle file
-        #pickle_file_path = os.path.join(ABS_PATH, 'instances.pkl')
 
-        # with open("./instances.pkl" , 'rb') as f:
-        #     self.instance_data = pickle.load(f)
-        self.ndelay = 1
-        self.problem_size = 50
-        self.neighbor_size = np.minimum(50,self.problem_size)
-        self.n_instance = 8  
-        self.running_time = 10
+def generate_neighborhood_matrix(distance_matrix, n_neighbors=None):
+    """
+    Row i holds the nodes sorted by their distance to node i, starting with i.
+    With n_neighbors, only the n_neighbors nearest nodes are kept (memory O(n * k)).
+    """
+    n = len(distance_matrix)
+    if n_neighbors is None or n_neighbors + 1 >= n:
+        return np.argsort(distance_matrix, axis=1)
 
+    nearest = np.argpartition(distance_matrix, n_neighbors, axis=1)[:, :n_neighbors + 1]
+    order = np.argsort(np.take_along_axis(distance_matrix, nearest, axis=1), axis=1)
+    return np.take_along_axis(nearest, order, axis=1)
 
 
-        self.prompts = GetPrompts()
+def tour_cost(instance, route):
+    """
+    Length of the closed tour.
+    """
+    route = np.asarray(route, dtype=int)
+    return np.sum(np.linalg.norm(instance[route] - instance[np.roll(route, -1)], axis=1))
 
-        getData = GetData(self.n_instance,self.problem_size)
-        self.instance_data = getData.generate_instances()
-        
 
-    def tour_cost(self,instance, solution, problem_size):
-        cost = 0
-        for j in range(problem_size - 1):
-            cost += np.linalg.norm(instance[int(solution[j])] - instance[int(solution[j + 1])])
-        cost += np.linalg.norm(instance[int(solution[-1])] - instance[int(solution[0])])
-        return cost
+def construct_tour(eva, instance, distance_matrix, neighbor_matrix, neighbor_size):
+    """
+    Builds the tour with the heuristic starting at node 0.
 
-    def generate_neighborhood_matrix(self,instance):
-        instance = np.array(instance)
-        n = len(instance)
-        neighborhood_matrix = np.zeros((n, n), dtype=int)
+    The heuristic gets the neighbor_size nearest unvisited nodes. If the
+    neighbour list of the node has less of them, they are taken from the
+    distance matrix. Returns the tour length or None if the heuristic
+    selected a visited node, and the seconds spent in the heuristic.
+    """
+    problem_size = len(instance)
+    truncated = neighbor_matrix.shape[1] < problem_size
+    heuristic_time = 0.0
 
-        for i in range(n):
-            distances = np.linalg.norm(instance[i] - instance, axis=1)
-            sorted_indices = np.argsort(distances)  # sort indices based on distances
-            neighborhood_matrix[i] = sorted_indices
+    destination_node = 0
 
-        return neighborhood_matrix
+    current_node = 0
 
+    route = np.zeros(problem_size, dtype=int)
+    visited = np.zeros(problem_size, dtype=bool)
+    visited[current_node] = True
+    for i in range(1, problem_size - 1):
 
-    #@func_set_timeout(5)
-    def greedy(self,eva):
+        near_nodes = neighbor_matrix[current_node][1:]
 
-        dis = np.ones(self.n_instance)
-        n_ins = 0
-        for instance, distance_matrix in self.instance_data:
+        unvisited_near_nodes = near_nodes[~visited[near_nodes]]
 
-            # get neighborhood matrix
-            neighbor_matrix = self.generate_neighborhood_matrix(instance)
+        unvisited_near_size = np.minimum(neighbor_size, problem_size - i)
 
+        if truncated and unvisited_near_nodes.size < unvisited_near_size:
+            unvisited_nodes = np.flatnonzero(~visited)
+            unvisited_near_nodes = unvisited_nodes[np.argsort(distance_matrix[current_node][unvisited_nodes])]
 
-            destination_node = 0
+        unvisited_near_nodes = unvisited_near_nodes[:unvisited_near_size]
 
-            current_node = 0
+        start_time = time.perf_counter()
+        next_node = eva.select_next_node(current_node, destination_node, unvisited_near_nodes, distance_matrix)
+        heuristic_time += time.perf_counter() - start_time
 
-            route = np.zeros(self.problem_size)
-            #print(">>> Step 0 : select node "+str(instance[0][0])+", "+str(instance[0][1]))
-            for i in range(1,self.problem_size-1):
+        if visited[next_node]:
+            return None, heuristic_time
 
-                near_nodes = neighbor_matrix[current_node][1:]
+        current_node = next_node
 
-                mask = ~np.isin(near_nodes,route[:i])
+        route[i] = current_node
+        visited[current_node] = True
 
-                unvisited_near_nodes = near_nodes[mask]
+    route[problem_size - 1] = np.flatnonzero(~visited)[0]
 
-                unvisited_near_size = np.minimum(self.neighbor_size,unvisited_near_nodes.size)
+    return tour_cost(instance, route), heuristic_time
 
-                unvisited_near_nodes = unvisited_near_nodes[:unvisited_near_size]
 
-                next_node = eva.select_next_node(current_node, destination_node, unvisited_near_nodes, distance_matrix)
+def timed_construct_tour(eva, *args):
+    """
+    Returns the tour length, the seconds of the heuristic and of the whole construction.
+    """
+    start_time = time.perf_counter()
+    cost, heuristic_time = construct_tour(eva, *args)
+    return cost, heuristic_time, time.perf_counter() - start_time
 
-                if next_node in route:
-                    #print("wrong algorithm select duplicate node, retrying ...")
-                    return None
 
-                current_node = next_node
+def construct_tour_from_source(code_string, *args):
+    """
+    Process pool entry point, the heuristic is shipped as source code.
+    """
+    with warnings.catch_warnings():
+        warnings.simplefilter("ignore")
+        heuristic_module = types.ModuleType("heuristic_module")
+        exec(code_string, heuristic_module.__dict__)
+        sys.modules[heuristic_module.__name__] = heuristic_module
+        return timed_construct_tour(heuristic_module, *args)
 
-                route[i] = current_node
 
-                #print(">>> Step "+str(i)+": select node "+str(instance[current_node][0])+", "+str(instance[current_node][1]))
+class TSPCONST():
+    def __init__(self, problem_size=50, n_instance=8, neighbor_size=50, n_jobs=1) -> None:
+        """
+        Parameters:
+        - problem_size (int): Number of nodes of each instance.
+        - n_instance (int): Number of instances.
+        - neighbor_size (int): Number of nearest unvisited nodes given to the heuristic.
+        - n_jobs (int): Number of processes to evaluate the instances of one heuristic.
+        """
+        # ABS_PATH = os.path.dirname(os.path.abspath(__file__))
+        # sys.path.append(ABS_PATH)  # This is for finding all the modules
+        # Construct the absolute path to the pickle file
+        #pickle_file_path = os.path.join(ABS_PATH, 'instances.pkl')
 
-            mask = ~np.isin(np.arange(self.problem_size),route[:self.problem_size-1])
+        # with open("./instances.pkl" , 'rb') as f:
+        #     self.instance_data = pickle.load(f)
+        self.ndelay = 1
+        self.problem_size = problem_size
+        self.neighbor_size = np.minimum(neighbor_size,self.problem_size)
+        self.n_instance = n_instance
+        self.n_jobs = n_jobs
+        self.running_time = 10
 
-            last_node = np.arange(self.problem_size)[mask]
 
-            current_node = last_node[0]
 
-            route[self.problem_size-1] = current_node
+        self.prompts = GetPrompts()
 
-            #print(">>> Step "+str(self.problem_size-1)+": select node "+str(instance[current_node][0])+", "+str(instance[current_node][1]))
+        getData = GetData(self.n_instance,self.problem_size)
+        self.instance_data = getData.generate_instances()
 
-            LLM_dis = self.tour_cost(instance,route,self.problem_size)
-            dis[n_ins] = LLM_dis
+        # the nearest neighbours of every node sorted by distance, computed once per instance
+        self.neighbor_matrices = [generate_neighborhood_matrix(distance_matrix, self.neighbor_size)
+                                  for _, distance_matrix in self.instance_data]
 
-            n_ins += 1
-            if n_ins == self.n_instance:
-                break
-            #self.route_plot(instance,route,self.oracle[n_ins])
+
+    def tour_cost(self,instance, solution, problem_size):
+        """
+        Length of the closed tour over the first problem_size nodes of the solution.
+        """
+        return tour_cost(instance, solution[:problem_size])
+
+    def get_fingerprint(self):
+        """
+        Hash of the instance settings, used by the fitness cache.
+        """
+        settings = {
+            'problem_size': self.problem_size,
+            'n_instance': self.n_instance,
+            'neighbor_size': int(self.neighbor_size),
+        }
+        return hashlib.sha256(json.dumps(settings, sort_keys=True).encode()).hexdigest()
+
+
+    #@func_set_timeout(5)
+    def greedy(self, eva, code_string=None):
+        """
+        Returns the average tour length and the details per instance, or None
+        if the heuristic selected a visited node.
+
+        With n_jobs > 1 and the heuristic code_string, the instances are
+        evaluated in a process pool.
+        """
+        tasks = [(instance, distance_matrix, neighbor_matrix, self.neighbor_size)
+                 for (instance, distance_matrix), neighbor_matrix in zip(self.instance_data, self.neighbor_matrices)]
+
+        if self.n_jobs > 1 and code_string is not None:
+            results = Parallel(n_jobs=self.n_jobs)(
+                delayed(construct_tour_from_source)(code_string, *task) for task in tasks)
+        else:
+            results = []
+            for task in tasks:
+                results.append(timed_construct_tour(eva, *task))
+                if results[-1][0] is None:
+                    break
+
+        if any(cost is None for cost, _, _ in results):
+            #print("wrong algorithm select duplicate node, retrying ...")
+            return None
+
+        dis = np.array([cost for cost, _, _ in results])
+        details = {
+            'tour_length': dis.tolist(),
+            'heuristic_time': [heuristic_time for _, heuristic_time, _ in results],
+            'eval_time': [eval_time for _, _, eval_time in results],
+        }
 
         ave_dis = np.average(dis)
         #print("average dis: ",ave_dis)
-        return ave_dis
+        return ave_dis, details
 
 
     def evaluate(self, code_string):
@@ -151,8 +234,11 @@ class TSPCONST():
                 sys.modules[heuristic_module.__name__] = heuristic_module
 
                 # Now you can use the module as you would any other
-                fitness = self.greedy(heuristic_module)
-                return fitness
+                result = self.greedy(heuristic_module, code_string)
+                if result is None:
+                    return None
+                fitness, details = result
+                return fitness, details
         except Exception as e:
             #print("Error:", str(e))
             return None
@@ -30,11 +30,18 @@ class Probs():
             print("- Prob local loaded ")
         elif paras.problem == "tsp_construct":
             from .optimization.tsp_greedy import run
-            self.prob = run.TSPCONST()
+            self.prob = run.TSPCONST(problem_size=paras.eva_tsp_problem_size,
+                                     n_instance=paras.eva_tsp_n_instance,
+                                     neighbor_size=paras.eva_tsp_neighbor_size,
+                                     n_jobs=paras.eva_instance_n_jobs)
             print("- Prob "+paras.problem+" loaded ")
         elif paras.problem == "bp_online":
             from .optimization.bp_online import run
-            self.prob = run.BPONLINE()
+            self.prob = run.BPONLINE(n_jobs=paras.eva_instance_n_jobs,
+                                     compact_bins=paras.eva_bp_compact_bins,
+                                     batch=paras.eva_bp_batch,
+                                     dataset_path=paras.eva_bp_dataset_path,
+                                     datasets=paras.eva_bp_datasets)
             print("- Prob "+paras.problem+" loaded ")
         elif paras.problem == "cap_set":
 
@@ -46,7 +53,13 @@ class Probs():
             print("- Prob " + paras.problem + " loaded ")
         elif paras.problem == "multibay_reshuffle":
             from .optimization.multibay_reshuffle import run
-            self.prob = run.MULTIBAY_RESHUFFLECONST(paras.eoh_experiment_file)
+            self.prob = run.MULTIBAY_RESHUFFLECONST(paras.eoh_experiment_file,
+                                                     n_jobs=paras.eva_instance_n_jobs,
+                                                     batch=paras.eva_multibay_batch,
+                                                     max_moves=paras.eva_max_moves,
+                                                     instance_timeout=paras.eva_instance_timeout,
+                                                     offspring_timeout=paras.eva_offspring_timeout,
+                                                     cycle_policy=paras.eva_cycle_policy)
             print("- Prob " + paras.problem + " loaded ")
         else:
             print("problem "+paras.problem+" not found!")
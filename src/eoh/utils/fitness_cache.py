@@ -0,0 +1,226 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import ast
+import json
+import math
+import time
+import sqlite3
+import hashlib
+
+import numpy as np
+
+FITNESS_CACHE_FILE = "fitness_cache.sqlite"
+
+
+class _LocalNameNormalizer(ast.NodeTransformer):
+    """
+    Removes docstrings and renames arguments and local variables of functions
+    to v0, v1, ... in the order of their first appearance.
+    """
+
+    def __init__(self):
+        self.scopes = []
+
+    def _strip_docstring(self, node):
+        body = node.body
+        if len(body) > 0 and isinstance(body[0], ast.Expr) \
+                and isinstance(body[0].value, ast.Constant) and isinstance(body[0].value.value, str):
+            node.body = body[1:] if len(body) > 1 else [ast.Pass()]
+
+    def _local(self, name):
+        scope = self.scopes[-1]
+        if name not in scope:
+            scope[name] = f"v{len(scope)}"
+        return scope[name]
+
+    def _lookup(self, name):
+        for scope in reversed(self.scopes):
+            if name in scope:
+                return scope[name]
+        return name
+
+    def visit_Module(self, node):
+        self._strip_docstring(node)
+        return self.generic_visit(node)
+
+    def visit_ClassDef(self, node):
+        self._strip_docstring(node)
+        return self.generic_visit(node)
+
+    def visit_FunctionDef(self, node):
+        self._strip_docstring(node)
+        node.decorator_list = [self.visit(d) for d in node.decorator_list]
+        self.scopes.append({})
+        node.args = self.visit(node.args)
+        node.body = [self.visit(statement) for statement in node.body]
+        self.scopes.pop()
+        node.returns = None
+        return node
+
+    visit_AsyncFunctionDef = visit_FunctionDef
+
+    def visit_Lambda(self, node):
+        self.scopes.append({})
+        node.args = self.visit(node.args)
+        node.body = self.visit(node.body)
+        self.scopes.pop()
+        return node
+
+    def visit_arg(self, node):
+        if self.scopes:
+            node.arg = self._local(node.arg)
+        node.annotation = None
+        return node
+
+    def visit_Name(self, node):
+        if not self.scopes:
+            return node
+        if isinstance(node.ctx, (ast.Store, ast.Del)):
+            node.id = self._local(node.id)
+        else:
+            node.id = self._lookup(node.id)
+        return node
+
+    def visit_ListComp(self, node):
+        # the targets of the generators are defined before the element is evaluated
+        node.generators = [self.visit(generator) for generator in node.generators]
+        if isinstance(node, ast.DictComp):
+            node.key = self.visit(node.key)
+            node.value = self.visit(node.value)
+        else:
+            node.elt = self.visit(node.elt)
+        return node
+
+    visit_SetComp = visit_ListComp
+    visit_GeneratorExp = visit_ListComp
+    visit_DictComp = visit_ListComp
+
+    def visit_Global(self, node):
+        # global names keep their name
+        if self.scopes:
+            for name in node.names:
+                self.scopes[-1][name] = name
+        return node
+
+    visit_Nonlocal = visit_Global
+
+    def visit_ExceptHandler(self, node):
+        if self.scopes and node.name:
+            node.name = self._local(node.name)
+        return self.generic_visit(node)
+
+
+def normalize_code(code: str) -> str:
+    """
+    Returns the code without comments, formatting, docstrings and with
+    renamed local variables. Code that cannot be parsed is only stripped.
+    """
+    try:
+        tree = ast.parse(code)
+    except SyntaxError:
+        return code.strip()
+    tree = _LocalNameNormalizer().visit(tree)
+    return ast.unparse(tree)
+
+
+def get_problem_fingerprint(problem) -> str:
+    """
+    Identifies the problem and its instances, problems can define get_fingerprint.
+    """
+    fingerprint = type(problem).__name__
+    if hasattr(problem, "get_fingerprint"):
+        fingerprint += ":" + problem.get_fingerprint()
+    return fingerprint
+
+
+def _to_json(value):
+    if isinstance(value, np.ndarray):
+        return value.tolist()
+    if isinstance(value, np.generic):
+        return value.item()
+    return str(value)
+
+
+class FitnessCache:
+    def __init__(self, path: str, fingerprint: str):
+        """
+        Persistent fitness values in a SQLite file, keyed by the hash of the
+        normalised code and the problem fingerprint.
+
+        Only the path is stored, every access opens its own connection, so the
+        cache can be shared by the worker processes of joblib.
+        """
+        self.path = path
+        self.fingerprint = fingerprint
+
+        with self._connect() as connection:
+            connection.execute("CREATE TABLE IF NOT EXISTS fitness "
+                               "(key TEXT PRIMARY KEY, fitness REAL, details TEXT, created REAL)")
+        connection.close()
+
+    def _connect(self):
+        return sqlite3.connect(self.path, timeout=60)
+
+    def get_key(self, code: str) -> str:
+        normalized = normalize_code(code)
+        return hashlib.sha256(f"{self.fingerprint}\n{normalized}".encode()).hexdigest()
+
+    def get(self, code: str):
+        """
+        Returns (fitness, details) of an equivalent code or None.
+        """
+        try:
+            connection = self._connect()
+            row = connection.execute("SELECT fitness, details FROM fitness WHERE key = ?",
+                                     (self.get_key(code),)).fetchone()
+            connection.close()
+        except sqlite3.Error as e:
+            print(f"[FITNESS_CACHE]: read failed: {e}")
+            return None
+
+        if row is None:
+            return None
+        return row[0], json.loads(row[1])
+
+    def put(self, code: str, fitness, details):
+        """
+        Stores the result of a finished evaluation.
+        """
+        if fitness is None or not math.isfinite(float(fitness)):
+            return
+        # the score of an aborted evaluation is only a lower bound
+        if isinstance(details, dict) and details.get('aborted', False):
+            return
+        # wall-clock timeouts depend on the load of the machine
+        if isinstance(details, dict) and any(details.get('timeouts', [])):
+            return
+
+        try:
+            connection = self._connect()
+            with connection:
+                connection.execute("INSERT OR REPLACE INTO fitness VALUES (?, ?, ?, ?)",
+                                   (self.get_key(code), float(fitness),
+                                    json.dumps(details, default=_to_json), time.time()))
+            connection.close()
+        except (sqlite3.Error, TypeError, ValueError) as e:
+            print(f"[FITNESS_CACHE]: write failed: {e}")
@@ -56,6 +56,8 @@ class Paras():
         self.llm_model = None  # model type for remote LLM, e.g., deepseek-chat
         self.llm_temperature = None
         self.llm_url_info = ""
+        self.llm_async = False  # send the requests with the asyncio client (keep-alive pool, backoff)
+        self.llm_max_in_flight = 8  # max concurrent requests of the asyncio client, shared by the offspring threads
 
         #####################
         ###  Exp settings  ###
@@ -72,12 +74,33 @@ class Paras():
         self.exp_continue_path = os.path.join(self.exp_output_path, self.exp_continue_folder, "pops",
                                               f"population_generation_{self.exp_continue_pop_nr}.json")
         self.exp_n_proc = 5
+        self.exp_pipeline = False  # overlap LLM requests and evaluations, requires eva_use_pool
+        self.exp_pipeline_queue_size = None  # generated offspring waiting for evaluation, default 2 * exp_n_proc
+        self.exp_steady_state = False  # insert every offspring immediately instead of per generation, requires eva_use_pool
+        self.exp_steady_state_in_flight = None  # offspring created at once in steady-state mode, default exp_n_proc
         
         #####################
         ###  Evaluation settings  ###
         #####################
         self.eva_timeout = 30
         self.eva_numba_decorator = False
+        self.eva_instance_n_jobs = 1  # number of processes for the instances of one evaluation (multibay_reshuffle, bp_online, tsp_construct)
+        self.eva_early_abort = False  # stop evaluations that cannot enter the population (multibay_reshuffle)
+        self.eva_multibay_batch = False  # heuristics score all states as one numpy array (multibay_reshuffle)
+        self.eva_max_moves = 100  # moves per instance, also the penalty of a timed out instance (multibay_reshuffle)
+        self.eva_instance_timeout = 60  # seconds per instance (multibay_reshuffle)
+        self.eva_offspring_timeout = None  # seconds for all instances of an offspring (multibay_reshuffle)
+        self.eva_cycle_policy = 'off'  # 'off', 'mask' or 'abort' moves back to a visited state (multibay_reshuffle)
+        self.eva_bp_compact_bins = False  # score only the open bins and one fresh bin, for element-wise heuristics (bp_online)
+        self.eva_bp_batch = False  # score the bins of all instances in one call, 'item' is an array, element-wise heuristics only (bp_online)
+        self.eva_bp_dataset_path = None  # directory with converted datasets, e.g. Weibull 100k (bp_online)
+        self.eva_bp_datasets = None  # names of the evaluated datasets, None for all (bp_online)
+        self.eva_tsp_problem_size = 50  # number of nodes per instance (tsp_construct)
+        self.eva_tsp_n_instance = 8  # number of instances (tsp_construct)
+        self.eva_tsp_neighbor_size = 50  # nearest unvisited nodes given to the heuristic (tsp_construct)
+        self.eva_use_pool = False  # evaluate in persistent worker processes, killed after eva_timeout
+        self.eva_pool_memory_limit = None  # memory limit of each pool worker in MB
+        self.eva_fitness_cache = False  # reuse the fitness of equivalent code, also across continued runs
 
 
     def set_parallel(self):
@@ -129,6 +152,18 @@ class Paras():
             self.eva_numba_decorator  = True
         elif self.problem == 'tsp_construct':
             self.eva_timeout = 20
+
+        if (self.exp_pipeline or self.exp_steady_state) and not self.eva_use_pool:
+            print("> pipeline and steady-state evaluate in the evaluation pool, enable eva_use_pool. ")
+            self.eva_use_pool = True
+
+        if self.llm_async and not self.eva_use_pool:
+            print("> the async LLM client shares its connections between the offspring threads, enable eva_use_pool. ")
+            self.eva_use_pool = True
+
+        if self.problem != 'multibay_reshuffle' and self.eva_early_abort:
+            print("> early abort is only supported for multibay_reshuffle, disable it. ")
+            self.eva_early_abort = False
                 
     def set_paras(self, *args, **kwargs):
         
@@ -40,11 +40,16 @@ from src.bay.source import Source
 from src.util.paths_util import get_working_dir
 
 
-def __read_layout(filename: str) -> np.ndarray:
-    """parses the csv file into a numpy array"""
+def get_layout_path(filename: str) -> str:
+    """returns the path of the layout file inside the warehouse_layouts folder"""
     base_path = os.path.join(os.getenv("BASE_PATH"), "warehouse_layouts")
     layout_file = "Size" + filename.split(r"Size")[-1]
-    filename =  os.path.join(base_path, layout_file)
+    return os.path.join(base_path, layout_file)
+
+
+def __read_layout(filename: str) -> np.ndarray:
+    """parses the csv file into a numpy array"""
+    filename = get_layout_path(filename)
 
     with open(filename) as csvfile:
         dialect = csv.Sniffer().sniff(csvfile.readline())
@@ -127,20 +132,43 @@ def __find_sources(layout: np.ndarray):
     return sources
 
 
-def __find_paths(layout: np.ndarray):
+def __find_paths(layout: np.ndarray, return_csr=False):
     """
     returns path as a graph (path nodes and edges)
+
+    Neighbours are found with shifted masks of the layout, the cost is linear
+    in the number of cells. With return_csr, the adjacency is also returned in
+    CSR form (indptr, indices) over the indices of path_nodes.
     """
     is_path = np.logical_or(layout == -5, layout == -6)
     Y_p, X_p = np.where(is_path)
     path_nodes = np.hstack((np.reshape(Y_p, (-1, 1)), np.reshape(X_p, (-1, 1))))
-    path_edges = []
-    for i in range(len(path_nodes)):
-        for j in range(i + 1, len(path_nodes)):
-            if abs(path_nodes[i][0] - path_nodes[j][0]) + abs(path_nodes[i][1] - path_nodes[j][1]) == 1:
-                edge = tuple(path_nodes[i]), tuple(path_nodes[j])
-                path_edges.append(edge)
-    return path_nodes, path_edges
+
+    node_index = np.full(layout.shape, -1)
+    node_index[Y_p, X_p] = np.arange(len(path_nodes))
+
+    # east and south neighbours of every path node
+    Y_e, X_e = np.where(is_path[:, :-1] & is_path[:, 1:])
+    Y_s, X_s = np.where(is_path[:-1, :] & is_path[1:, :])
+    edge_from = np.concatenate((node_index[Y_e, X_e], node_index[Y_s, X_s]))
+    edge_to = np.concatenate((node_index[Y_e, X_e + 1], node_index[Y_s + 1, X_s]))
+
+    # same order as comparing all pairs of nodes
+    order = np.lexsort((edge_to, edge_from))
+    edge_from = edge_from[order]
+    edge_to = edge_to[order]
+
+    path_edges = [(tuple(path_nodes[i]), tuple(path_nodes[j])) for i, j in zip(edge_from, edge_to)]
+
+    if not return_csr:
+        return path_nodes, path_edges
+
+    rows = np.concatenate((edge_from, edge_to))
+    columns = np.concatenate((edge_to, edge_from))
+    order = np.lexsort((columns, rows))
+    indptr = np.zeros(len(path_nodes) + 1, dtype=np.int64)
+    indptr[1:] = np.cumsum(np.bincount(rows, minlength=len(path_nodes)))
+    return path_nodes, path_edges, (indptr, columns[order])
 
 
 def __find_access_points(layout: np.ndarray, bays: List, access_directions: dict):
@@ -192,7 +220,8 @@ def layout_to_bays(filename: str, access_directions: dict):
     """
     Parses a layout into bays and path graph
 
-    Returns a dictionary containing lists of bays, sinks, path nodes and edges and the dimensions of the layout
+    Returns a dictionary containing lists of bays, sinks, path nodes and edges, the CSR adjacency
+    of the path nodes and the dimensions of the layout
     """
     layout = __read_layout(filename)
     sources = __find_sources(layout)
@@ -204,11 +233,12 @@ def layout_to_bays(filename: str, access_directions: dict):
     __find_access_points(layout, sources, sinkAndSourceAccessDirections)
     __find_access_points(layout, bays, access_directions)
     __find_access_points(layout, sinks, sinkAndSourceAccessDirections)
-    path_nodes, path_edges = __find_paths(layout)
+    path_nodes, path_edges, path_csr = __find_paths(layout, return_csr=True)
     return {
         "bays": bays,
         "path_nodes": path_nodes,
         "edges": path_edges,
+        "path_csr": path_csr,
         "length": len(layout),
         "width": len(layout[0]),
         "sinks": sinks,
@@ -27,7 +27,10 @@ import json
 import numpy as np
 from src.util.paths_util import get_working_dir, read_all_json_files
 
+from src.bay.lane_matrix import LaneMatrix
 from src.bay.virtual_lane import VirtualLane
+from src.util.instance_pack import INSTANCE_PACK_DIR, InstancePack, has_instance_pack
+from src.util.successor_util import generate_successors
 
 
 def convert_list_to_vl(vl_list: list, ap_ids: list):
@@ -48,10 +51,24 @@ def get_ap_ids_from_vl(virtual_lanes: list):
     return [vl.ap_id for vl in virtual_lanes]
 
 
-def get_virtual_lane_score(virtual_lanes: list, reversed=False):
+def get_virtual_lane_score(virtual_lanes, reversed=False):
+    """
+    Returns the number of unsorted lanes, virtual_lanes is a list of lists or a LaneMatrix.
+    """
+    if isinstance(virtual_lanes, LaneMatrix):
+        return virtual_lanes.get_virtual_lane_score(reversed)
     return sum([1 for lane in virtual_lanes if sorted(lane, reverse=reversed) != lane])
 
 
+def get_state_bytes(virtual_lanes) -> bytes:
+    """
+    Canonical bytes of a warehouse state, virtual_lanes is a list of VirtualLane objects or a LaneMatrix.
+    """
+    if not isinstance(virtual_lanes, LaneMatrix):
+        virtual_lanes = LaneMatrix.from_virtual_lanes(virtual_lanes)
+    return virtual_lanes.to_bytes()
+
+
 def get_access_directions(config):
     access_directions = config['bay_info']['0']['access_directions']
     return {
@@ -62,7 +79,34 @@ def get_access_directions(config):
     }
 
 
-def load_experiments(file):
+def get_experiment_filenames(data):
+    """
+    Instance filenames of an experiment file, in the order of the experiments.
+    """
+    filenames = []
+    for s in data["seed"]:
+        for bay in data["bay"]:
+            for warehouse in data["warehouse"]:
+                for fill in data["fill"]:
+                    for priority in data["priority"]:
+                        filenames.append(f'test_file_Size_{bay}x{bay}_'
+                                         f'Layout_{warehouse}x{warehouse}_'
+                                         f'fill_lvl_{fill}_'
+                                         f'seed_{s}_'
+                                         f'max_p_{priority}_'
+                                         f'ad_access_directions_'
+                                         f'{data["access_directions"]}.json')
+    return filenames
+
+
+def load_experiments(file, pack_path=None):
+    """
+    Loads the instances of an experiment file and their h_initial.
+
+    The instances are read from the pack (see instance_pack) if one exists in
+    pack_path, by default INSTANCES_PATH/instance_pack, else from the json files.
+    Instance files changed after the pack was built are read from the json file.
+    """
     instance_path = os.getenv('INSTANCES_PATH')
     experiment_path = os.path.join(os.getenv('BASE_PATH'), "eoh_experiment")
 
@@ -70,37 +114,41 @@ def load_experiments(file):
     experiment_solution = []
 
     try:
-        f_exp = open(os.path.join(experiment_path, file))
-        data = json.load(f_exp)
-    except:
-        print("[ERROR]: load_experiments failed - experiment file does not exists!")
+        with open(os.path.join(experiment_path, file)) as f_exp:
+            data = json.load(f_exp)
+    except (OSError, json.JSONDecodeError) as e:
+        print(f"[ERROR]: load_experiments failed - experiment file does not exists! {e}")
         exit(1)
 
-    for s in data["seed"]:
-        for bay in data["bay"]:
-            for warehouse in data["warehouse"]:
-                for fill in data["fill"]:
-                    for priority in data["priority"]:
+    if pack_path is None:
+        pack_path = os.path.join(instance_path, INSTANCE_PACK_DIR)
+    pack = InstancePack(pack_path) if has_instance_pack(pack_path) else None
+    n_stale = 0
 
-                        try:
-                            f_inst = open(os.path.join(instance_path,
-                                                       f'test_file_Size_{bay}x{bay}_'
-                                                       f'Layout_{warehouse}x{warehouse}_'
-                                                       f'fill_lvl_{fill}_'
-                                                       f'seed_{s}_'
-                                                       f'max_p_{priority}_'
-                                                       f'ad_access_directions_'
-                                                       f'{data["access_directions"]}.json'))
-
-                            instance = json.load(f_inst)
-                            experiment_instances.append(instance)
-                            experiment_solution.append(instance['h_initial'])
-
-                        except:
-                            print("[ERROR]: load_experiments failed - file does not exists!")
-                            print(f"[ERROR]: seed: {s}, bay: {bay}, warehouse: {warehouse}, "
-                                  f"fill: {fill}, priority: {priority}")
-                            print("---> continue with other files...")
+    for filename in get_experiment_filenames(data):
+        try:
+            use_pack = pack is not None and filename in pack
+            if use_pack and not pack.is_fresh(filename, instance_path):
+                use_pack = False
+                n_stale += 1
+
+            if use_pack:
+                instance = pack.get_config(pack.get_index(filename))
+            else:
+                with open(os.path.join(instance_path, filename)) as f_inst:
+                    instance = json.load(f_inst)
+
+            experiment_solution.append(instance['h_initial'])
+            experiment_instances.append(instance)
+
+        except (OSError, json.JSONDecodeError, KeyError) as e:
+            print(f"[ERROR]: load_experiments failed - file does not exists or is invalid! {e!r}")
+            print(f"[ERROR]: {filename}")
+            print("---> continue with other files...")
+
+    if n_stale > 0:
+        print(f"[WARNING]: {n_stale} instance files changed since the instance pack was built, "
+              f"they are read from json. Rebuild the pack with 'pack'.")
 
     return experiment_instances, experiment_solution
 
@@ -122,6 +170,29 @@ def generate_instances(number_of_instances: int, path=get_working_dir()) -> list
     return instance_configs
 
 
+def get_instance_lanes(config) -> LaneMatrix:
+    """
+    Lanes of an instance config as LaneMatrix, a copy which can be modified.
+    Configs from the instance pack already hold the matrix, see InstancePack.get_config.
+    """
+    if "lane_matrix" in config:
+        return config["lane_matrix"].copy()
+    return LaneMatrix.from_lists([lane["stacks"] for lane in config["virtual_lanes"]],
+                                 [lane["ap_id"] for lane in config["virtual_lanes"]])
+
+
+def get_instance_json(config) -> dict:
+    """
+    Instance config in the format of the instance files.
+    """
+    if "lane_matrix" not in config:
+        return config
+    instance = {key: value for key, value in config.items() if key != "lane_matrix"}
+    instance["virtual_lanes"] = [{"ap_id": int(lane.ap_id), "stacks": lane.stacks.tolist()}
+                                 for lane in config["lane_matrix"].to_virtual_lanes()]
+    return instance
+
+
 def create_virtual_lane(data):
     lanes = []
     for virtual_lane in data["virtual_lanes"]:
@@ -158,35 +229,9 @@ def create_virtual_lane_reversed(data, max_value):
 
 
 def create_lanes(wh, reversed=False):
-    lanes = wh.virtual_lanes
-
-    loads = []
-    slots = []
-    for i in range(len(lanes)):
-        if np.any(lanes[i].stacks != 0):
-            loads.append(i)
-        if 0 in lanes[i].stacks:
-            slots.append(i)
-
-    successors = []
-    moves = []
-    from_lanes = loads
-    to_lanes = slots
-    for from_lane in from_lanes:
-        for to_lane in to_lanes:
-
-            if from_lane == to_lane:
-                continue
-
-            new_lane = lanes[:]
-            if reversed:
-                new_lane[from_lane], stacks = lanes[from_lane].remove_load_reversed()
-                new_lane[to_lane] = lanes[to_lane].add_load_reversed(stacks)
-            else:
-                new_lane[from_lane], stacks = lanes[from_lane].remove_load()
-                new_lane[to_lane] = lanes[to_lane].add_load(stacks)
-
-            successors.append(new_lane)
-            moves.append([lanes[from_lane].ap_id, lanes[to_lane].ap_id])
-
-    return successors, moves
+    """
+    Returns all successor states of the warehouse and the corresponding moves.
+    The successors are evaluated lazily, see SuccessorStates.
+    """
+    successors = generate_successors(wh.virtual_lanes, reversed)
+    return successors, successors.get_moves()
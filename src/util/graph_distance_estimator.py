@@ -21,9 +21,12 @@
 # SOFTWARE.
 
 
+import os
 import numpy as np
 
 from collections import defaultdict
+from scipy.sparse import csr_matrix
+from scipy.sparse.csgraph import shortest_path
 
 def __dfs(start_node, neighbors, distance = None, parent = None):
     """dfs, probably unnecessary for this application"""
@@ -75,6 +78,85 @@ def estimate_distances_bfs(nodes, neighbors):
     
     return graph_distance
 
+def estimate_distances_csr(nodes, path_nodes, path_csr):
+    """
+    estimates distances between bays' access points with a compiled bfs
+    over the csr adjacency of the path graph
+
+    Unreachable nodes have the distance np.inf.
+
+    nodes: list(tuple), y,x of the access points
+    path_nodes: np.ndarray, y,x of all path cells
+    path_csr: tuple, (indptr, indices) adjacency over the indices of path_nodes
+    """
+    indptr, indices = path_csr
+    adjacency = csr_matrix((np.ones(len(indices)), indices, indptr),
+                           shape=(len(path_nodes), len(path_nodes)))
+
+    index = {tuple(node): i for i, node in enumerate(path_nodes.tolist())}
+    sources = np.array([index.get(tuple(node), -1) for node in nodes], dtype=int)
+    on_path = sources >= 0
+
+    graph_distance = np.full((len(nodes), len(nodes)), np.inf)
+    np.fill_diagonal(graph_distance, 0)
+    if np.any(on_path):
+        distance = shortest_path(adjacency, method='D', unweighted=True, indices=sources[on_path])
+        graph_distance[np.ix_(on_path, on_path)] = distance[:, sources[on_path]]
+
+    return graph_distance
+
+
+class AccessPointDistances:
+    def __init__(self, nodes, path_nodes, path_csr, cache_file=None, layout_file=None):
+        """
+        Lazy distance matrix between all access points of a warehouse.
+
+        The matrix is computed on first access. If cache_file is set, it is
+        stored as .npy file and memory-mapped by later runs, unless the layout
+        file is newer than the cache.
+        """
+        self.nodes = nodes
+        self.path_nodes = path_nodes
+        self.path_csr = path_csr
+        self.cache_file = cache_file
+        self.layout_file = layout_file
+        self.matrix = None
+
+    def get_matrix(self) -> np.ndarray:
+        if self.matrix is None:
+            self.matrix = self.__load()
+        if self.matrix is None:
+            self.matrix = estimate_distances_csr(self.nodes, self.path_nodes, self.path_csr)
+            self.__save(self.matrix)
+        return self.matrix
+
+    def __load(self):
+        if self.cache_file is None or not os.path.exists(self.cache_file):
+            return None
+        if self.layout_file is not None and os.path.exists(self.layout_file) \
+                and os.path.getmtime(self.layout_file) > os.path.getmtime(self.cache_file):
+            return None
+        try:
+            matrix = np.load(self.cache_file, mmap_mode='r')
+        except (OSError, ValueError):
+            return None
+        if matrix.shape != (len(self.nodes), len(self.nodes)):
+            return None
+        return matrix
+
+    def __save(self, matrix):
+        if self.cache_file is None:
+            return
+        # write to a temporary file first, parallel workers may save the same matrix
+        tmp_file = f"{self.cache_file}.{os.getpid()}.tmp.npy"
+        try:
+            np.save(tmp_file, matrix)
+            os.replace(tmp_file, self.cache_file)
+        except OSError:
+            if os.path.exists(tmp_file):
+                os.remove(tmp_file)
+
+
 def edges_to_neighbors(edges):
     """
     turns edges of an undirected graph into a "neighbors" dictionary
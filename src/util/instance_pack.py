@@ -0,0 +1,200 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Columnar pack of an instance directory, loaded with memory mapping instead
+of one json file per instance.
+
+The pack is a directory with the lanes of all instances as one padded
+matrix (stacks.npy, like LaneMatrix), the lane lengths, ap ids, the first
+lane of every instance (offsets.npy), h_initial and index.json, which maps
+the instance filenames to their row and holds the remaining fields by
+column, every distinct value is stored once. Only ap_id and stacks of the
+virtual lanes are packed, a loaded config holds them as LaneMatrix.
+
+The index also records the modification time and size of every instance
+file, a pack entry is only used while its file is unchanged (is_fresh).
+"""
+
+import os
+import copy
+import json
+
+import numpy as np
+
+from src.bay.lane_matrix import LaneMatrix
+from src.util.paths_util import read_all_json_files
+
+# Default pack directory inside INSTANCES_PATH
+INSTANCE_PACK_DIR = "instance_pack"
+INSTANCE_PACK_VERSION = 2
+
+_COLUMNS = ["stacks", "lengths", "ap_ids", "offsets", "h_initial"]
+
+
+def build_instance_pack(instance_path, pack_path=None) -> int:
+    """
+    Compiles all instance files of a directory into a pack, returns the number of instances.
+    """
+    if pack_path is None:
+        pack_path = os.path.join(instance_path, INSTANCE_PACK_DIR)
+    os.makedirs(pack_path, exist_ok=True)
+
+    filenames = sorted(read_all_json_files(instance_path))
+    lanes, ap_ids, offsets, h_initial, meta, stats = [], [], [0], [], [], []
+
+    for filename in filenames:
+        file_path = os.path.join(instance_path, filename)
+        stats.append(get_file_stat(file_path))
+        with open(file_path) as f:
+            instance = json.load(f)
+
+        for virtual_lane in instance.pop("virtual_lanes"):
+            lanes.append(virtual_lane["stacks"])
+            ap_ids.append(virtual_lane["ap_id"])
+        offsets.append(len(lanes))
+        h_initial.append(instance.pop("h_initial", np.nan))
+        meta.append(instance)
+
+    lane_matrix = LaneMatrix.from_lists(lanes, ap_ids, dtype=np.int16)
+    columns = {
+        "stacks": lane_matrix.stacks,
+        "lengths": lane_matrix.lengths,
+        "ap_ids": lane_matrix.ap_ids,
+        "offsets": np.array(offsets, dtype=np.int64),
+        "h_initial": np.array(h_initial, dtype=np.float64),
+    }
+    for name, column in columns.items():
+        np.save(os.path.join(pack_path, f"{name}.npy"), column)
+
+    index = {
+        "version": INSTANCE_PACK_VERSION,
+        "files": {filename: i for i, filename in enumerate(filenames)},
+        "stats": stats,
+        "meta": encode_meta(meta),
+    }
+    # written last, a pack without index is incomplete
+    tmp_file = os.path.join(pack_path, "index.json.tmp")
+    with open(tmp_file, "w") as f:
+        json.dump(index, f)
+    os.replace(tmp_file, os.path.join(pack_path, "index.json"))
+
+    return len(filenames)
+
+
+def get_file_stat(file_path) -> list:
+    """
+    Modification time and size, compared with the index to detect changed instance files.
+    """
+    stat = os.stat(file_path)
+    return [stat.st_mtime_ns, stat.st_size]
+
+
+def encode_meta(meta: list) -> dict:
+    """
+    Fields of all instances by key, as the distinct values and the value index of every instance (-1 if missing).
+    """
+    columns = {}
+    for i, instance in enumerate(meta):
+        for key, value in instance.items():
+            column = columns.setdefault(key, {"values": [], "codes": [-1] * len(meta), "lookup": {}})
+            value_key = json.dumps(value, sort_keys=True)
+            if value_key not in column["lookup"]:
+                column["lookup"][value_key] = len(column["values"])
+                column["values"].append(value)
+            column["codes"][i] = column["lookup"][value_key]
+
+    return {key: {"values": column["values"], "codes": column["codes"]} for key, column in columns.items()}
+
+
+def has_instance_pack(pack_path) -> bool:
+    return os.path.isfile(os.path.join(pack_path, "index.json"))
+
+
+class InstancePack:
+    def __init__(self, pack_path):
+        """
+        Read only view of a pack, the columns are memory-mapped.
+        """
+        self.pack_path = pack_path
+        with open(os.path.join(pack_path, "index.json")) as f:
+            index = json.load(f)
+
+        if index.get("version") != INSTANCE_PACK_VERSION:
+            raise ValueError(f"Instance pack version {index.get('version')} is not supported, rebuild the pack")
+
+        self.files = index["files"]
+        self.stats = index["stats"]
+        self.meta = index["meta"]
+        self.n_instances = len(index["stats"])
+        for name in _COLUMNS:
+            column = np.load(os.path.join(pack_path, f"{name}.npy"), mmap_mode="r")
+            # plain ndarray view of the mapping, slicing a memmap object is slow
+            setattr(self, name, column.view(np.ndarray))
+
+    def __len__(self):
+        return self.n_instances
+
+    def __contains__(self, filename):
+        return filename in self.files
+
+    def get_index(self, filename) -> int:
+        return self.files[filename]
+
+    def is_fresh(self, filename, instance_path) -> bool:
+        """
+        True if the instance file was not changed since the pack was built.
+        """
+        try:
+            return get_file_stat(os.path.join(instance_path, filename)) == self.stats[self.files[filename]]
+        except OSError:
+            return False
+
+    def get_lane_matrix(self, i) -> LaneMatrix:
+        """
+        Lanes of instance i, a copy which can be modified.
+        """
+        start, end = self.offsets[i], self.offsets[i + 1]
+        lengths = np.array(self.lengths[start:end])
+        stacks = np.array(self.stacks[start:end, :lengths.max(initial=0)])
+        return LaneMatrix(stacks, lengths, np.array(self.ap_ids[start:end]))
+
+    def get_h_initial(self, i):
+        h_initial = float(self.h_initial[i])
+        if np.isnan(h_initial):
+            return None
+        return int(h_initial) if h_initial.is_integer() else h_initial
+
+    def get_config(self, i) -> dict:
+        """
+        Instance i in the format of the instance files, but with the lanes as
+        LaneMatrix under "lane_matrix" instead of the "virtual_lanes" dicts.
+        The config owns its values, changing it does not change other instances.
+        """
+        config = {key: copy.deepcopy(column["values"][column["codes"][i]])
+                  for key, column in self.meta.items() if column["codes"][i] >= 0}
+        config["lane_matrix"] = self.get_lane_matrix(i)
+        h_initial = self.get_h_initial(i)
+        if h_initial is not None:
+            config["h_initial"] = h_initial
+        return config
+
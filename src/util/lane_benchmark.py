@@ -0,0 +1,158 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Per-move cost of the reshuffling simulator, the loop body of
+mutlibay_reshuffeling: generate the successors, build the heuristic input
+of all of them, apply one move and check if all lanes are sorted. The
+moves are chosen at random with the same seed for all simulators, the
+heuristic itself is not measured.
+
+The baseline is the original loop on VirtualLane objects, which built and
+converted every successor state for every move. The LaneMatrix loop is
+measured with the nested lists (as_lists, every state is read) and with
+the array of the batch heuristics (as_tensor), each with and without the
+numba kernels.
+
+    python -m src.util.lane_benchmark
+"""
+
+import time
+
+import numpy as np
+
+from src.bay import lane_kernels
+from src.bay.lane_matrix import LaneMatrix
+from src.bay.virtual_lane import VirtualLane
+from src.util.eoh_util import convert_vl_to_list, get_virtual_lane_score
+from src.util.successor_util import generate_successors
+
+
+def generate_lanes(n_lanes, depth, fill, max_priority, rng):
+    """
+    Random lanes of equal depth, the loads are at the back of the lanes.
+    """
+    lanes = []
+    for ap_id in range(n_lanes):
+        n_loads = rng.binomial(depth, fill)
+        stacks = np.zeros(depth, dtype=np.int64)
+        stacks[depth - n_loads:] = rng.integers(1, max_priority + 1, n_loads)
+        lanes.append(VirtualLane(stacks, ap_id))
+    return lanes
+
+
+def create_all_successors(lanes):
+    """
+    All successor states as lists of VirtualLane objects, like the original create_lanes.
+    """
+    loads = [i for i in range(len(lanes)) if np.any(lanes[i].stacks != 0)]
+    slots = [i for i in range(len(lanes)) if 0 in lanes[i].stacks]
+
+    successors = []
+    for from_lane in loads:
+        for to_lane in slots:
+            if from_lane == to_lane:
+                continue
+            new_lane = lanes[:]
+            new_lane[from_lane], priority = lanes[from_lane].remove_load()
+            new_lane[to_lane] = lanes[to_lane].add_load(priority)
+            successors.append(new_lane)
+    return successors
+
+
+def run_virtual_lanes(lanes, n_moves, rng) -> int:
+    """
+    Original simulator on VirtualLane objects: every successor is built and converted to lists.
+    Returns the number of moves made.
+    """
+    get_virtual_lane_score(convert_vl_to_list(lanes))
+    for move in range(n_moves):
+        successors = create_all_successors(lanes)
+        if len(successors) == 0:
+            return move
+        [convert_vl_to_list(successor) for successor in successors]
+        lanes = successors[rng.integers(len(successors))]
+        get_virtual_lane_score(convert_vl_to_list(lanes))
+    return n_moves
+
+
+def run_lane_matrix(lanes: LaneMatrix, n_moves, rng, batch=False) -> int:
+    """
+    Loop of mutlibay_reshuffeling, returns the number of moves made.
+    """
+    lanes.get_unsorted_count()
+    for move in range(n_moves):
+        successors = generate_successors(lanes)
+        if len(successors) == 0:
+            return move
+        if batch:
+            successors.as_tensor()
+        else:
+            # a heuristic reads every state
+            for _ in successors.as_lists():
+                pass
+        from_lane, to_lane, _ = successors.deltas[rng.integers(len(successors))]
+        lanes.apply_move(from_lane, to_lane)
+        lanes.get_unsorted_count()
+    return n_moves
+
+
+def benchmark_lanes(n_lanes=30, depth=5, fill=0.6, max_priority=5, n_instances=20, n_moves=100, seed=2024):
+    """
+    Returns the mean time per move in microseconds by simulator.
+    """
+    instances = [generate_lanes(n_lanes, depth, fill, max_priority, np.random.default_rng(seed + i))
+                 for i in range(n_instances)]
+
+    simulators = {"virtual_lanes": lambda lanes, rng: run_virtual_lanes(lanes, n_moves, rng)}
+    for batch, input_name in [(False, "lists"), (True, "tensor")]:
+        simulator = (lambda batch: lambda lanes, rng: run_lane_matrix(
+            LaneMatrix.from_virtual_lanes(lanes), n_moves, rng, batch))(batch)
+        simulators[f"lane_matrix_{input_name}_numpy"] = simulator
+        if lane_kernels.HAS_NUMBA:
+            simulators[f"lane_matrix_{input_name}_numba"] = simulator
+
+    use_kernels = lane_kernels.USE_KERNELS
+    results = {}
+    try:
+        for name, simulator in simulators.items():
+            lane_kernels.USE_KERNELS = name.endswith("_numba")
+            # compiles the kernels before the measurement
+            simulator(instances[0], np.random.default_rng(seed))
+
+            moves_made = 0
+            start_time = time.perf_counter()
+            for i, lanes in enumerate(instances):
+                moves_made += simulator(lanes, np.random.default_rng(seed + i))
+            results[name] = (time.perf_counter() - start_time) / max(moves_made, 1) * 1e6
+    finally:
+        lane_kernels.USE_KERNELS = use_kernels
+
+    return results
+
+
+if __name__ == '__main__':
+    for n_lanes in [10, 30, 100]:
+        print(f"--- {n_lanes} lanes ---")
+        # the baseline builds every successor, fewer moves keep the large sizes short
+        for name, time_per_move in benchmark_lanes(n_lanes=n_lanes, n_instances=5, n_moves=20).items():
+            print(f"{name}: {time_per_move:.1f} us per move")
@@ -0,0 +1,295 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+"""
+Exact and bounded-suboptimal search for the minimal number of reshuffling
+moves of an instance, used to compute reference move counts offline.
+
+The neighbourhood is the one of the evaluation (eoh_util.create_lanes):
+the next load of a lane with loads moves to the next free slot of another
+lane. The lower bound is the number of blocking loads, every blocking load
+has to be moved at least once.
+"""
+
+import os
+import json
+import time
+import heapq
+import itertools
+
+import numpy as np
+from joblib import Parallel, delayed
+
+from src.bay.lane_matrix import LaneMatrix
+from src.util.paths_util import read_all_json_files
+
+ASTAR = "astar"
+IDASTAR = "idastar"
+
+# Value above all priorities, used for the slots without loads
+NO_LOAD = np.iinfo(np.int16).max
+
+
+def count_blocking_loads(stacks: np.ndarray, valid: np.ndarray) -> np.ndarray:
+    """
+    Number of loads with a load of a higher priority behind them, for the
+    lanes of one state (lanes x depth) or of many states (states x lanes x depth).
+    """
+    loads = (stacks > 0) & valid
+    priorities = np.where(loads, stacks, NO_LOAD).astype(np.int16)
+    # lowest priority value behind each slot
+    behind = np.minimum.accumulate(priorities[..., ::-1], axis=-1)[..., ::-1]
+    blocking = loads[..., :-1] & (priorities[..., :-1] > behind[..., 1:])
+    return np.count_nonzero(blocking, axis=(-2, -1))
+
+
+class ReshuffleSearch:
+    def __init__(self, lanes: LaneMatrix, node_budget=None, time_budget=None):
+        """
+        Search over the states of the lanes, a state is the stacks matrix.
+
+        node_budget limits the number of expanded states and time_budget the
+        seconds of a search. The transposition table maps the bytes of a
+        state to the lowest number of moves it was reached with.
+        """
+        self.start = lanes.stacks.copy()
+        self.shape = self.start.shape
+        self.dtype = self.start.dtype
+        self.valid = lanes.valid_slots()
+        self.ap_ids = lanes.ap_ids
+        self.lengths = lanes.lengths
+
+        self.node_budget = node_budget
+        self.time_budget = time_budget
+
+        self.expanded = 0
+        self.end_time = None
+
+    def get_lower_bound(self, stacks: np.ndarray) -> int:
+        return int(count_blocking_loads(stacks, self.valid))
+
+    def get_children(self, stacks: np.ndarray):
+        """
+        Returns all successor states (states x lanes x depth), their lower bounds and moves.
+        """
+        lanes = LaneMatrix(stacks, self.lengths, self.ap_ids)
+        from_lanes, to_lanes, priorities = lanes.get_moves()
+        children = np.repeat(stacks[np.newaxis], len(from_lanes), axis=0)
+        index = np.arange(len(from_lanes))
+        children[index, from_lanes, lanes.top_load_indices()[from_lanes]] = 0
+        children[index, to_lanes, lanes.free_slot_indices()[to_lanes]] = priorities
+        return children, count_blocking_loads(children, self.valid), zip(from_lanes.tolist(), to_lanes.tolist())
+
+    def to_key(self, stacks: np.ndarray) -> bytes:
+        return stacks.tobytes()
+
+    def from_key(self, key: bytes) -> np.ndarray:
+        return np.frombuffer(key, dtype=self.dtype).reshape(self.shape).copy()
+
+    def over_budget(self) -> bool:
+        if self.node_budget is not None and self.expanded >= self.node_budget:
+            return True
+        return self.end_time is not None and time.perf_counter() > self.end_time
+
+    def get_path(self, parents: dict, key: bytes) -> list:
+        path = []
+        while parents[key] is not None:
+            key, from_lane, to_lane = parents[key]
+            path.append([int(self.ap_ids[from_lane]), int(self.ap_ids[to_lane])])
+        return path[::-1]
+
+    def astar(self, weight=1.0) -> dict:
+        """
+        A* with f = g + weight * h. With weight 1 the solution is optimal,
+        otherwise it has at most weight times the optimal number of moves.
+        """
+        start_time = time.perf_counter()
+        self.end_time = None if self.time_budget is None else start_time + self.time_budget
+
+        start_key = self.to_key(self.start)
+        start_h = self.get_lower_bound(self.start)
+        best_g = {start_key: 0}
+        parents = {start_key: None}
+        counter = itertools.count()
+        # (f, h, tie breaker, g, key)
+        open_list = [(weight * start_h, start_h, next(counter), 0, start_key)]
+        lower_bound = start_h
+
+        while open_list:
+            f, h, _, g, key = heapq.heappop(open_list)
+            if g > best_g[key]:
+                continue
+            if weight == 1.0:
+                lower_bound = max(lower_bound, int(f))
+
+            if h == 0:
+                return self.get_result(g, weight == 1.0, g if weight == 1.0 else lower_bound,
+                                       self.get_path(parents, key), start_time)
+
+            if self.over_budget():
+                return self.get_result(None, False, lower_bound, None, start_time)
+            self.expanded += 1
+
+            children, child_h, moves = self.get_children(self.from_key(key))
+            for child, h_child, (from_lane, to_lane) in zip(children, child_h.tolist(), moves):
+                child_key = self.to_key(child)
+                if g + 1 < best_g.get(child_key, np.inf):
+                    best_g[child_key] = g + 1
+                    parents[child_key] = (key, from_lane, to_lane)
+                    heapq.heappush(open_list, (g + 1 + weight * h_child, h_child, next(counter), g + 1, child_key))
+
+        return self.get_result(None, True, lower_bound, None, start_time)
+
+    def idastar(self) -> dict:
+        """
+        IDA*, optimal with memory linear in the depth. The transposition
+        table of an iteration prunes states reached again with more moves.
+        """
+        start_time = time.perf_counter()
+        self.end_time = None if self.time_budget is None else start_time + self.time_budget
+
+        threshold = self.get_lower_bound(self.start)
+        path = []
+
+        while True:
+            table = {}
+            result = self.__depth_first(self.start, 0, threshold, path, table)
+            if result == 0:
+                return self.get_result(len(path), True, len(path), path, start_time)
+            if result is None:
+                return self.get_result(None, False, threshold, None, start_time)
+            if result == np.inf:
+                return self.get_result(None, True, threshold, None, start_time)
+            threshold = result
+
+    def __depth_first(self, stacks, g, threshold, path, table):
+        """
+        Returns 0 if a solution was found, None if the budget is exceeded
+        and else the lowest f above the threshold.
+        """
+        h = self.get_lower_bound(stacks)
+        if g + h > threshold:
+            return g + h
+        if h == 0:
+            return 0
+        if self.over_budget():
+            return None
+
+        key = self.to_key(stacks)
+        if table.get(key, np.inf) <= g:
+            return np.inf
+        table[key] = g
+        self.expanded += 1
+
+        children, child_h, moves = self.get_children(stacks)
+        # most promising children first
+        order = np.argsort(child_h, kind="stable")
+        moves = list(moves)
+
+        minimum = np.inf
+        for i in order:
+            from_lane, to_lane = moves[i]
+            path.append([int(self.ap_ids[from_lane]), int(self.ap_ids[to_lane])])
+            result = self.__depth_first(children[i], g + 1, threshold, path, table)
+            if result == 0 or result is None:
+                return result
+            path.pop()
+            minimum = min(minimum, result)
+        return minimum
+
+    def get_result(self, moves, complete, lower_bound, path, start_time):
+        if moves is not None:
+            status = "optimal" if complete else "solved"
+        else:
+            status = "infeasible" if complete else "budget"
+        return {
+            'moves': moves,
+            'status': status,
+            'lower_bound': int(lower_bound),
+            'expanded': self.expanded,
+            'time': time.perf_counter() - start_time,
+            'path': path,
+        }
+
+
+def solve_instance(config, algorithm=ASTAR, weight=1.0, node_budget=None, time_budget=None) -> dict:
+    """
+    Computes the minimal (weight 1) or bounded-suboptimal number of moves of an instance.
+    """
+    lanes = LaneMatrix.from_lists([lane["stacks"] for lane in config["virtual_lanes"]],
+                                  [lane["ap_id"] for lane in config["virtual_lanes"]],
+                                  dtype=np.int16)
+    search = ReshuffleSearch(lanes, node_budget, time_budget)
+    if algorithm == IDASTAR:
+        return search.idastar()
+    return search.astar(weight)
+
+
+def get_json_indent(text: str):
+    """
+    Indentation of a json document, None if it is written on one line.
+    """
+    lines = text.splitlines()
+    if len(lines) < 2:
+        return None
+    indent = lines[1][:len(lines[1]) - len(lines[1].lstrip())]
+    if indent == "":
+        return None
+    return indent if "\t" in indent else len(indent)
+
+
+def write_instance_file(file_path, config, indent=None, trailing_newline=False):
+    """
+    Replaces the instance file atomically, an interrupted write leaves the old file.
+    """
+    tmp_file = f"{file_path}.tmp{os.getpid()}"
+    with open(tmp_file, 'w') as f:
+        json.dump(config, f, indent=indent)
+        if trailing_newline:
+            f.write("\n")
+    os.replace(tmp_file, file_path)
+
+
+def solve_instance_file(path, filename, reference_key=None, **kwargs) -> dict:
+    file_path = os.path.join(path, filename)
+    with open(file_path) as f:
+        text = f.read()
+    config = json.loads(text)
+
+    result = solve_instance(config, **kwargs)
+
+    # optionally store the reference in the instance, in the formatting of the file
+    if reference_key is not None and result['moves'] is not None:
+        config[reference_key] = result['moves']
+        write_instance_file(file_path, config, get_json_indent(text), text.endswith("\n"))
+
+    return result
+
+
+def solve_instance_directory(path, n_jobs=-1, reference_key=None, **kwargs) -> dict:
+    """
+    Solves all instance files of a directory in parallel, returns the results by filename.
+    """
+    filenames = sorted(read_all_json_files(path))
+    results = Parallel(n_jobs=n_jobs)(
+        delayed(solve_instance_file)(path, filename, reference_key, **kwargs) for filename in filenames)
+    return dict(zip(filenames, results))
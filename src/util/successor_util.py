@@ -0,0 +1,229 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+
+import numpy as np
+from typing import List, Tuple
+from collections.abc import Sequence
+
+from src.bay import lane_kernels
+from src.bay.lane_matrix import LaneMatrix
+
+
+def _top_load_index(stacks: np.ndarray, reversed=False) -> int:
+    """
+    Index of the load that is removed next (see VirtualLane.remove_load).
+    """
+    loads = np.flatnonzero(stacks)
+    return int(loads[-1] if reversed else loads[0])
+
+
+def _free_slot_index(stacks: np.ndarray, reversed=False) -> int:
+    """
+    Index of the slot that is filled next (see VirtualLane.add_load).
+    """
+    slots = np.flatnonzero(stacks == 0)
+    return int(slots[0] if reversed else slots[-1])
+
+
+class SuccessorStates:
+    """
+    All warehouse states reachable from one base state with a single move.
+
+    Every successor is stored as a delta (from_lane, to_lane, priority) over the
+    shared base lanes. Full states are only materialised on request, either as
+    a list of VirtualLane objects (indexing), as nested lists (as_lists) or as
+    one numpy array (as_tensor).
+    """
+
+    def __init__(self, lanes: list, deltas: List[Tuple[int, int, int]], reversed=False, matrix: LaneMatrix = None):
+        # base state, list of VirtualLane objects which is never modified
+        self.lanes = lanes
+        # base state as LaneMatrix if generated from one, saves the conversion in as_tensor
+        self.matrix = matrix
+        # (from_lane, to_lane, moved priority) with lane indices into self.lanes
+        self.deltas = deltas
+        self.reversed = reversed
+
+    def __len__(self):
+        return len(self.deltas)
+
+    def __iter__(self):
+        for index in range(len(self.deltas)):
+            yield self[index]
+
+    def __getitem__(self, index: int) -> list:
+        """
+        Materialises the successor as a list of VirtualLane objects.
+        Untouched lanes are shared with the base state.
+        """
+        from_lane, to_lane, _ = self.deltas[index]
+
+        new_lanes = self.lanes[:]
+        if self.reversed:
+            new_lanes[from_lane], priority = self.lanes[from_lane].remove_load_reversed()
+            new_lanes[to_lane] = self.lanes[to_lane].add_load_reversed(priority)
+        else:
+            new_lanes[from_lane], priority = self.lanes[from_lane].remove_load()
+            new_lanes[to_lane] = self.lanes[to_lane].add_load(priority)
+        return new_lanes
+
+    def get_moves(self) -> List[list]:
+        """
+        Returns the moves as [from ap_id, to ap_id] pairs in successor order.
+        """
+        return [[self.lanes[f].ap_id, self.lanes[t].ap_id] for f, t, _ in self.deltas]
+
+    def as_lists(self) -> "LazyStates":
+        """
+        All successors as three levels nested lists (successor, lane, slot),
+        the input format of the evolved heuristics. The states are built on
+        first access, see LazyStates.
+        """
+        return LazyStates(self)
+
+    def as_tensor(self) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        Materialises all successors as one array (successor x lane x slot),
+        the input format of the batch heuristics. Slots behind the end of a
+        shorter lane are PADDING.
+
+        Also returns the moves as array (successor x 3) with the rows
+        [from_lane, to_lane, moved priority].
+        """
+        base = self.matrix
+        if base is None:
+            base = LaneMatrix.from_virtual_lanes(self.lanes, dtype=np.int64)
+        moves = np.array(self.deltas, dtype=np.int64).reshape(-1, 3)
+        from_lanes, to_lanes, priorities = moves.T
+
+        # copying the base is memory bound, numpy is faster than a compiled loop here
+        states = np.repeat(base.stacks.astype(np.int64)[np.newaxis], len(moves), axis=0)
+        if lane_kernels.USE_KERNELS:
+            lane_kernels.apply_successor_moves(states, base.stacks, np.ascontiguousarray(from_lanes),
+                                               np.ascontiguousarray(to_lanes), np.ascontiguousarray(priorities),
+                                               self.reversed)
+            return states, moves
+
+        successors = np.arange(len(moves))
+        states[successors, from_lanes, base.top_load_indices(self.reversed)[from_lanes]] = 0
+        states[successors, to_lanes, base.free_slot_indices(self.reversed)[to_lanes]] = priorities
+
+        return states, moves
+
+
+def generate_successors(lanes, reversed=False) -> SuccessorStates:
+    """
+    Generates all single moves from a lane with loads to another lane with
+    free slots. Only the deltas are stored, the cost is linear in the number
+    of lanes plus the number of moves.
+
+    lanes is either a list of VirtualLane objects or a LaneMatrix.
+    """
+    if isinstance(lanes, LaneMatrix):
+        from_index, to_index, priorities = lanes.get_moves(reversed)
+        deltas = list(zip(from_index.tolist(), to_index.tolist(), priorities.tolist()))
+        return SuccessorStates(lanes.to_virtual_lanes(), deltas, reversed, lanes)
+
+    loads = []
+    slots = []
+    priorities = {}
+    for i in range(len(lanes)):
+        if np.any(lanes[i].stacks != 0):
+            loads.append(i)
+            priorities[i] = int(lanes[i].stacks[_top_load_index(lanes[i].stacks, reversed)])
+        if 0 in lanes[i].stacks:
+            slots.append(i)
+
+    deltas = [(from_lane, to_lane, priorities[from_lane])
+              for from_lane in loads
+              for to_lane in slots
+              if from_lane != to_lane]
+
+    return SuccessorStates(lanes, deltas, reversed)
+
+
+class LazyStates(Sequence):
+    def __init__(self, successors: SuccessorStates):
+        """
+        Successor states as nested lists, state i is only built when it is
+        indexed or iterated and then kept, so repeated access returns the
+        same lists.
+
+        The base state is converted once. Each state gets its own lane lists,
+        a heuristic modifying its input cannot affect other states. Lanes are
+        not shared between states, a heuristic could copy all states at once
+        (copy.deepcopy keeps shared lists shared) and then modify them.
+        """
+        self.deltas = successors.deltas
+        self.reversed = successors.reversed
+
+        # heuristics always see the same integer type, also for LaneMatrix views
+        # copies, the lanes of a LaneMatrix are views which change with the next move
+        self.base_stacks = [np.array(lane.stacks, dtype=np.int64) for lane in successors.lanes]
+        self.base = [list(stacks) for stacks in self.base_stacks]
+
+        self.states = [None] * len(self.deltas)
+        self.removed = {}
+        self.added = {}
+
+    def __len__(self):
+        return len(self.deltas)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        if index < 0:
+            index += len(self)
+        state = self.states[index]
+        if state is None:
+            state = self.states[index] = self.__build(index)
+        return state
+
+    def __iter__(self):
+        for index in range(len(self)):
+            yield self[index]
+
+    def __eq__(self, other):
+        if isinstance(other, (list, LazyStates)):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+
+    __hash__ = None
+
+    def __build(self, index) -> list:
+        from_lane, to_lane, priority = self.deltas[index]
+        if from_lane not in self.removed:
+            slot = _top_load_index(self.base_stacks[from_lane], self.reversed)
+            lane = self.base[from_lane][:]
+            lane[slot] = np.int64(0)
+            self.removed[from_lane] = lane, self.base[from_lane][slot]
+        lane, load = self.removed[from_lane]
+        if (to_lane, priority) not in self.added:
+            new_lane = self.base[to_lane][:]
+            new_lane[_free_slot_index(self.base_stacks[to_lane], self.reversed)] = load
+            self.added[(to_lane, priority)] = new_lane
+
+        state = list(map(list.copy, self.base))
+        state[from_lane] = lane[:]
+        state[to_lane] = self.added[(to_lane, priority)][:]
+        return state
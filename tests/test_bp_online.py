@@ -0,0 +1,43 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import numpy as np
+import pytest
+
+from src.eoh.problems.optimization.bp_online.run import is_elementwise
+
+
+def best_fit(item, bins):
+    return -(bins - item)
+
+
+def mean_fit(item, bins):
+    return -np.abs(bins - item - 0.3 * np.mean(bins))
+
+
+@pytest.mark.parametrize("batch", [False, True])
+def test_elementwise_heuristics_are_detected(batch):
+    assert is_elementwise(best_fit, 100, batch)
+    assert not is_elementwise(mean_fit, 100, batch)
+
+
+def test_failing_heuristics_are_not_elementwise():
+    assert not is_elementwise(lambda item, bins: bins[1] - item, 100)
@@ -0,0 +1,52 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+import json
+
+from src.util.eoh_util import get_instance_json, get_instance_lanes
+from src.util.instance_pack import InstancePack, build_instance_pack
+
+INSTANCES = {
+    'a.json': {'layout_file': 'Size_3x3_Layout_1x1.csv', 'bay_info': {'0': {'access_directions': ['north']}},
+               'h_initial': 2, 'virtual_lanes': [{'ap_id': 1, 'stacks': [0, 2, 1]}, {'ap_id': 3, 'stacks': [1]}]},
+    'b.json': {'layout_file': 'Size_3x3_Layout_1x1.csv', 'bay_info': {'0': {'access_directions': ['north']}},
+               'h_initial': 0, 'virtual_lanes': [{'ap_id': 1, 'stacks': [0, 0]}]},
+}
+
+
+def load_pack(tmp_path):
+    for filename, instance in INSTANCES.items():
+        (tmp_path / filename).write_text(json.dumps(instance))
+    build_instance_pack(str(tmp_path))
+    pack = InstancePack(str(tmp_path / 'instance_pack'))
+    return [pack.get_config(pack.get_index(filename)) for filename in INSTANCES]
+
+
+def test_pack_configs_match_the_instance_files(tmp_path):
+    for config, instance in zip(load_pack(tmp_path), INSTANCES.values()):
+        assert get_instance_json(config) == instance
+        assert get_instance_lanes(config) == get_instance_lanes(instance)
+
+
+def test_pack_configs_do_not_share_values(tmp_path):
+    configs = load_pack(tmp_path)
+    configs[0]['bay_info']['0']['access_directions'].append('south')
+    assert configs[1]['bay_info']['0']['access_directions'] == ['north']
@@ -0,0 +1,94 @@
+# Copyright (c) 2025
+#           Thomas Bömer (thomas.bömer@tu-dortmund.de)
+#           Nico Koltermann (nico.koltermann@tu-dortmund.de)
+#
+# Permission is hereby granted, free of charge, to any person obtaining a copy
+# of this software and associated documentation files (the "Software"), to deal
+# in the Software without restriction, including without limitation the rights
+# to use, copy, modify, merge, publish, distribute, sublicense, and/or sell
+# copies of the Software, and to permit persons to whom the Software is
+# furnished to do so, subject to the following conditions:
+#
+# The above copyright notice and this permission notice shall be included in all
+# copies or substantial portions of the Software.
+#
+# THE SOFTWARE IS PROVIDED "AS IS", WITHOUT WARRANTY OF ANY KIND, EXPRESS OR
+# IMPLIED, INCLUDING BUT NOT LIMITED TO THE WARRANTIES OF MERCHANTABILITY,
+# FITNESS FOR A PARTICULAR PURPOSE AND NONINFRINGEMENT. IN NO EVENT SHALL THE
+# AUTHORS OR COPYRIGHT HOLDERS BE LIABLE FOR ANY CLAIM, DAMAGES OR OTHER
+# LIABILITY, WHETHER IN AN ACTION OF CONTRACT, TORT OR OTHERWISE, ARISING FROM,
+# OUT OF OR IN CONNECTION WITH THE SOFTWARE OR THE USE OR OTHER DEALINGS IN THE
+# SOFTWARE.
+
+import os
+
+import pytest
+
+from src.eoh.problems.optimization.multibay_reshuffle import run
+
+BASE_PATH = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+HEURISTIC = '''
+def select_next_move(warehouse_states):
+    return [-sum(lane != sorted(lane) for lane in state) for state in warehouse_states]
+'''
+
+
+def make_config(stacks):
+    return {
+        'layout_file': 'Size_3x3_Layout_1x1.csv',
+        'bay_info': {'0': {'access_directions': ['north']}},
+        'virtual_lanes': [{'ap_id': 2 * i + 1, 'stacks': lane} for i, lane in enumerate(stacks)],
+    }
+
+
+@pytest.fixture(autouse=True)
+def base_path(monkeypatch):
+    monkeypatch.setenv('BASE_PATH', BASE_PATH)
+
+
+def test_min_instance_score_is_capped_by_max_moves():
+    config = make_config([[2, 1], [2, 1], [2, 1], [0, 0]])
+    assert run.get_move_lower_bound(config) == 3
+    assert run.get_min_instance_score(config, 2, max_moves=1) == run.get_instance_score(1, 2)
+
+
+@pytest.mark.parametrize("max_moves", [1, 2, 100])
+def test_racing_does_not_abort_an_offspring_below_the_worst_objective(max_moves):
+    # the last instance has more unsorted lanes than max_moves for small max_moves
+    configs = [make_config([[0, 2, 1], [0, 0, 0]]),
+               make_config([[0, 1], [0, 2], [0, 0]]),
+               make_config([[2, 1], [2, 1], [2, 1], [0, 0]])]
+    ref_scores = [1, 1, 3]
+    heuristic = run.load_heuristic(HEURISTIC)
+
+    fitness, details = run.eval_multibay_reshuffle(heuristic, configs, ref_scores, max_moves=max_moves)
+    assert not details['aborted']
+
+    raced_fitness, raced_details = run.eval_multibay_reshuffle(heuristic, configs, ref_scores,
+                                                               worst_objective=fitness + 1e-9,
+                                                               max_moves=max_moves)
+    assert not raced_details['aborted']
+    assert raced_fitness == pytest.approx(fitness)
+
+
+def test_instance_pool_is_kept_unless_the_evaluation_is_aborted():
+    configs = [make_config([[0, 2, 1], [0, 0, 0]]),
+               make_config([[2, 1], [2, 1], [2, 1], [0, 0]])]
+    ref_scores = [1, 3]
+    heuristic = run.load_heuristic(HEURISTIC)
+
+    try:
+        run.eval_multibay_reshuffle(heuristic, configs, ref_scores, n_jobs=2, code_string=HEURISTIC)
+        pool = run._INSTANCE_POOL
+        assert pool is not None
+
+        run.eval_multibay_reshuffle(heuristic, configs, ref_scores, n_jobs=2, code_string=HEURISTIC)
+        assert run._INSTANCE_POOL is pool
+
+        _, details = run.eval_multibay_reshuffle(heuristic, configs, ref_scores, n_jobs=2, code_string=HEURISTIC,
+                                                 worst_objective=-10)
+        assert details['aborted']
+        assert run._INSTANCE_POOL is None
+    finally:
+        run.close_instance_pool()